@@ -22,6 +22,9 @@ from .const import (
     DEFAULT_DEVICE_ID,
 )
 
+_DEVICE_ID_RE = re.compile(r"^\d+$")
+_FREQUENCY_RE = re.compile(r"^\d+(\.\d+)?M?$")
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_DEVICE_ID, default=DEFAULT_DEVICE_ID): str,
@@ -58,11 +61,11 @@ class RTL433ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 protocol_filter = user_input.get(CONF_PROTOCOL_FILTER, "")
 
                 # Validate device ID format
-                if not re.match(r"^\d+$", device_id):
+                if not _DEVICE_ID_RE.match(device_id):
                     errors[CONF_DEVICE_ID] = "invalid_device_id"
 
                 # Validate frequency format
-                if not re.match(r"^\d+(\.\d+)?M?$", frequency):
+                if not _FREQUENCY_RE.match(frequency):
                     errors[CONF_FREQUENCY] = "invalid_frequency"
 
                 # Validate gain range
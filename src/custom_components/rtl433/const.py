@@ -11,7 +11,7 @@ documentation for improved maintainability.
 """
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Set, TypedDict, Union
+from typing import Dict, Optional, Tuple, TypedDict, Union
 
 from homeassistant.const import (
     UnitOfTemperature,
@@ -46,6 +46,10 @@ DEFAULT_DEVICE_ID: str = "0"
 #
 EVENT_DEVICE_MESSAGE: str = "rtl433_device_message"
 
+# Dispatcher signal sent with the devices a coordinator discovered since its
+# last update, formatted with the coordinator's RTL-SDR device ID
+SIGNAL_NEW_DEVICE: str = "rtl433_new_device_{}"
+
 #
 # Error Messages
 #
@@ -58,7 +62,7 @@ ERROR_INVALID_SENSOR_VALUE: str = "Invalid sensor value received"
 #
 # Protocol Validation
 #
-VALID_PROTOCOLS: Set[str] = {
+VALID_PROTOCOLS: frozenset[str] = frozenset({
     "Acurite-5n1",
     "Acurite-Tower",
     "LaCrosse-TX141W",
@@ -69,7 +73,7 @@ VALID_PROTOCOLS: Set[str] = {
     "Prologue-TH",
     "Rubicson-Temperature",
     "WT450",
-}
+})
 
 # Protocol-specific value ranges
 class ValueRange(TypedDict):
@@ -204,11 +208,37 @@ SENSOR_TYPES: Dict[str, SensorTypeInfo] = {
     },
 }
 
+# Sensor types shown in the diagnostic entity category
+DIAGNOSTIC_SENSOR_TYPES: frozenset[str] = frozenset({"battery_ok", "rssi", "snr", "noise"})
+
+# Sensor types that report signal metrics
+SIGNAL_SENSOR_TYPES: frozenset[str] = frozenset({"rssi", "snr", "noise"})
+
+# SENSOR_TYPES flattened to (device_class, state_class, unit, icon, diagnostic)
+SENSOR_ATTRS: Dict[
+    str, Tuple[Optional[str], Optional[str], Optional[str], str, bool]
+] = {
+    sensor_type: (
+        info["device_class"],
+        info["state_class"],
+        info["unit"],
+        info["icon"],
+        sensor_type in DIAGNOSTIC_SENSOR_TYPES,
+    )
+    for sensor_type, info in SENSOR_TYPES.items()
+}
+
+# Title-cased sensor type used in entity names, e.g. "Temperature C"
+SENSOR_DISPLAY_FRAGMENT: Dict[str, str] = {
+    sensor_type: sensor_type.replace("_", " ").title()
+    for sensor_type in SENSOR_TYPES
+}
+
 #
 # Device Capabilities
 #
-DEVICE_SENSORS: Dict[str, List[str]] = {
-    MODEL_ACURITE_5N1: [
+DEVICE_SENSORS: Dict[str, Tuple[str, ...]] = {
+    MODEL_ACURITE_5N1: (
         "temperature_C",
         "humidity",
         "wind_speed_kph",
@@ -218,13 +248,13 @@ DEVICE_SENSORS: Dict[str, List[str]] = {
         "rssi",
         "snr",
         "noise",
-    ],
-    MODEL_LACROSSE_TX141W: [
+    ),
+    MODEL_LACROSSE_TX141W: (
         "temperature_C",
         "humidity",
         "battery_ok",
         "rssi",
         "snr",
         "noise",
-    ],
+    ),
 } 
\ No newline at end of file
@@ -2,18 +2,28 @@
 from __future__ import annotations
 
 import asyncio
+import fcntl
 import json
 import logging
 import subprocess
 import os
-from datetime import timedelta
-from typing import Any, Dict, Optional, Set, Callable
+import re
+import shlex
+from collections import deque
+from itertools import islice
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Optional, Set, Callable, Coroutine
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    json_loads = json.loads
 
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity import DeviceInfo, Entity
-from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.const import (
     ATTR_BATTERY_LEVEL,
     ATTR_NAME,
@@ -30,6 +40,7 @@ from .const import (
     DEFAULT_FREQUENCY,
     DEFAULT_GAIN,
     DEVICE_SENSORS,
+    SIGNAL_NEW_DEVICE,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -50,6 +61,14 @@ NOISE_GOOD = -35      # dBm
 NOISE_FAIR = -30      # dBm
 NOISE_POOR = -25      # dBm
 
+# Signal quality tiers as (name, min RSSI, min SNR, max noise), best first
+_QUALITY_TIERS = (
+    ("excellent", SIGNAL_EXCELLENT, SNR_EXCELLENT, NOISE_EXCELLENT),
+    ("good", SIGNAL_GOOD, SNR_GOOD, NOISE_GOOD),
+    ("fair", SIGNAL_FAIR, SNR_FAIR, NOISE_FAIR),
+    ("poor", SIGNAL_POOR, SNR_POOR, NOISE_POOR),
+)
+
 SUPPORTED_SENSOR_TYPES = {
     "temperature_C": ("Temperature", "°C"),
     "temperature_F": ("Temperature", "°F"),
@@ -65,9 +84,126 @@ SUPPORTED_SENSOR_TYPES = {
     "noise": ("Noise Level", "dB"),
 }
 
+# Signal quality levels that count towards a poor-signal warning
+_POOR_QUALITIES = frozenset(("poor", "unusable"))
+
+# stderr messages that indicate the RTL-SDR device is unusable
+_CRITICAL_STDERR_RE = re.compile(
+    rb"usb_claim_interface error|device not found|device or resource busy",
+    re.IGNORECASE,
+)
+
+# StreamReader buffer limit for rtl_433 output; also the longest accepted line
+STREAM_LIMIT = 1024 * 1024  # bytes
+
+# RTL2832U based dongles as (idVendor, idProduct) in sysfs format, mirroring
+# the known device table of librtlsdr
+RTLSDR_USB_IDS = frozenset({
+    ("0bda", "2832"), ("0bda", "2838"), ("0413", "6680"), ("0413", "6f0f"),
+    ("0458", "707f"), ("0ccd", "00a9"), ("0ccd", "00b3"), ("0ccd", "00b4"),
+    ("0ccd", "00b5"), ("0ccd", "00b7"), ("0ccd", "00b8"), ("0ccd", "00b9"),
+    ("0ccd", "00c0"), ("0ccd", "00c6"), ("0ccd", "00d3"), ("0ccd", "00d7"),
+    ("0ccd", "00e0"), ("1554", "5020"), ("15f4", "0131"), ("15f4", "0133"),
+    ("185b", "0620"), ("185b", "0650"), ("185b", "0680"), ("1b80", "d393"),
+    ("1b80", "d394"), ("1b80", "d395"), ("1b80", "d397"), ("1b80", "d398"),
+    ("1b80", "d39d"), ("1b80", "d3a4"), ("1b80", "d3a8"), ("1b80", "d3af"),
+    ("1b80", "d3b0"), ("1d19", "1101"), ("1d19", "1102"), ("1d19", "1103"),
+    ("1d19", "1104"), ("1f4d", "a803"), ("1f4d", "b803"), ("1f4d", "c803"),
+    ("1f4d", "d286"), ("1f4d", "d803"),
+})
+SYSFS_USB_DEVICES = "/sys/bus/usb/devices"
+USBDEVFS_RESET = 0x5514  # _IO('U', 20) from linux/usbdevice_fs.h
+
+# Delay used to coalesce bursts of frames into a single listener update
+UPDATE_FLUSH_DELAY = 0.25  # seconds
+
+# Upper bound for the watchdog's restart backoff
+MAX_RETRY_DELAY = 300  # seconds
+
 # Default protocols to enable if none specified
 DEFAULT_PROTOCOLS = [1, 2, 3, 4, 8, 10, 11, 12, 18, 19, 20, 32, 34, 40, 41, 42, 47, 52, 54, 55, 73, 74, 75, 76]
 
+# Pre-joined sensor lists per model for discovery logging
+_SENSOR_CSV: Dict[str, str] = {
+    model: ", ".join(sensors) for model, sensors in DEVICE_SENSORS.items()
+}
+
+
+def _read_sysfs(path: str) -> str:
+    """Read a single sysfs attribute."""
+    with open(path, encoding="ascii") as attr:
+        return attr.read().strip()
+
+
+def _find_rtlsdr_usb_path(device_id: str) -> Optional[str]:
+    """Return the usbfs node of the RTL-SDR dongle rtl_433 would open.
+
+    librtlsdr numbers dongles in libusb enumeration order, which sysfs can't
+    reproduce reliably, so an index is only resolved when exactly one dongle
+    is attached. A ":<serial>" device_id is matched by serial number. In all
+    other cases None is returned and the caller falls back to other resets.
+    """
+    device_id = str(device_id)
+    serial = device_id[1:] if device_id.startswith(":") else None
+    if serial is None and device_id != "0":
+        return None
+
+    try:
+        entries = os.listdir(SYSFS_USB_DEVICES)
+    except OSError:
+        return None
+
+    matches = []
+    for entry in entries:
+        base = os.path.join(SYSFS_USB_DEVICES, entry)
+        try:
+            usb_id = (_read_sysfs(f"{base}/idVendor"), _read_sysfs(f"{base}/idProduct"))
+            if usb_id not in RTLSDR_USB_IDS:
+                continue
+            if serial is not None and _read_sysfs(f"{base}/serial") != serial:
+                continue
+            matches.append(
+                (int(_read_sysfs(f"{base}/busnum")), int(_read_sysfs(f"{base}/devnum")))
+            )
+        except (OSError, ValueError):
+            continue
+
+    # With several candidates we could reset a dongle owned by another entry
+    if len(matches) != 1:
+        return None
+    busnum, devnum = matches[0]
+    return f"/dev/bus/usb/{busnum:03d}/{devnum:03d}"
+
+
+def _usbfs_reset(path: str) -> None:
+    """Reset a USB device through its usbfs node."""
+    with open(path, "wb") as node:
+        fcntl.ioctl(node, USBDEVFS_RESET, 0)
+
+
+# Keys of an rtl_433 record that identify the device rather than a reading
+_NON_SENSOR_KEYS = frozenset(("model", "id", "brand", "protocol"))
+
+
+def _format_sensor_value(key: str, value: Any) -> Any:
+    """Format sensor values consistently."""
+    if isinstance(value, (int, float)):
+        # Round floating point values to 2 decimal places
+        return round(float(value), 2)
+    if key == "battery_ok":
+        return bool(value)
+    return value
+
+
+def _format_sensor_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Format every reading of an rtl_433 record, keeping non-numeric values."""
+    return {
+        key: _format_sensor_value(key, value)
+        for key, value in data.items()
+        if key not in _NON_SENSOR_KEYS and value is not None
+    }
+
+
 class RTL433Coordinator(DataUpdateCoordinator):
     """Class to manage fetching RTL-433 data."""
 
@@ -85,49 +221,48 @@ class RTL433Coordinator(DataUpdateCoordinator):
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=30),
+            update_interval=None,  # Data is pushed by the rtl_433 reader
+            always_update=False,
         )
         self.hass = hass
         self.device_id = device_id
         self.frequency = frequency
         self.gain = gain
-        self.protocol_filter = [int(p) for p in protocol_filter] if protocol_filter else DEFAULT_PROTOCOLS
+        self.new_device_signal = SIGNAL_NEW_DEVICE.format(device_id)
+        self.known_entity_ids: Set[str] = set()  # Entities created by platforms
+        self.protocol_filter = (
+            frozenset(int(p) for p in protocol_filter)
+            if protocol_filter
+            else frozenset(DEFAULT_PROTOCOLS)
+        )
+        self._rtl_cmd = self._build_command()
+        self._rtl_cmd_str = shlex.join(self._rtl_cmd)
         self._process: Optional[asyncio.subprocess.Process] = None
         self._shutdown = False
-        self._retry_count = 0
-        self._max_retries = 3
         self._retry_delay = 5  # seconds
+        self._tasks: Set[asyncio.Task] = set()
         self._known_devices: Set[str] = set()
+        self._new_device_ids: list[str] = []  # Discovered since the last flush
         self._device_init_attempts = 0
         self._max_device_init_attempts = 3
         self._device_init_delay = 2  # seconds
-        self._add_entities_callback: Optional[AddEntitiesCallback] = None
+        self._device_verified = False
+        self._usb_path: Optional[str] = None
+        self._usb_path_scanned = False
         self._entity_cleanup_callbacks: Dict[str, Callable] = {}
-        self._signal_quality_history: Dict[str, list] = {}
+        self._signal_quality_history: Dict[str, deque[str]] = {}
         self._last_device_update: Dict[str, str] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
         
-        # Initialize data storage
-        self.data: Dict[str, Dict[str, Any]] = {}
-        self._pending_devices: Dict[str, Dict[str, Any]] = {}
-
-    def register_add_entities_callback(self, callback: AddEntitiesCallback) -> None:
-        """Register the callback to add entities."""
-        self._add_entities_callback = callback
-        # Process any pending devices
-        if self._pending_devices and self._add_entities_callback:
-            for device_id, device_data in self._pending_devices.items():
-                if device_id not in self._known_devices:
-                    self._process_new_device(device_id, device_data)
-            self._pending_devices.clear()
+        # Initialize data storage; listeners get a read-only view of the
+        # per-device records, which are updated in place
+        self._devices: Dict[str, Dict[str, Any]] = {}
+        self.data: MappingProxyType[str, Dict[str, Any]] = MappingProxyType(self._devices)
 
     def _process_new_device(self, device_id: str, device_data: Dict[str, Any]) -> None:
-        """Process a newly discovered device."""
-        if not self._add_entities_callback:
-            self._pending_devices[device_id] = device_data
-            return
-
+        """Announce a newly discovered device to the entity platforms."""
         model = device_data.get("model")
-        if not model or model not in DEVICE_SENSORS:
+        if model not in _SENSOR_CSV:
             return
 
         self._known_devices.add(device_id)
@@ -135,36 +270,75 @@ class RTL433Coordinator(DataUpdateCoordinator):
             "Processing new device - Model: %s, ID: %s, Available sensors: %s",
             model,
             device_id,
-            ", ".join(DEVICE_SENSORS[model])
+            _SENSOR_CSV[model],
         )
+        # Announced together with the next coalesced update
+        self._new_device_ids.append(device_id)
 
     async def _async_update_data(self) -> Dict[str, Any]:
-        """Fetch data from RTL-433."""
+        """Ensure the RTL-433 process is running and return the current data."""
         if self._shutdown:
             raise UpdateFailed("Coordinator is shutting down")
 
         try:
             return await self._fetch_rtl433_data()
-        except Exception as err:
-            self._retry_count += 1
-            if self._retry_count >= self._max_retries:
-                self._retry_count = 0
-                raise UpdateFailed(f"Failed to fetch RTL-433 data after {self._max_retries} attempts: {err}")
-            
-            _LOGGER.warning(
-                "Failed to fetch RTL-433 data (attempt %d/%d): %s",
-                self._retry_count,
-                self._max_retries,
-                err,
-            )
-            await asyncio.sleep(self._retry_delay)
-            return await self._async_update_data()
+        except ConfigEntryNotReady as err:
+            raise UpdateFailed(str(err)) from err
+
+    async def async_config_entry_first_refresh(self) -> None:
+        """Start the RTL-433 process and its health watchdog."""
+        await super().async_config_entry_first_refresh()
+        self._spawn(self._watch_process())
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> asyncio.Task:
+        """Start a background task that is cancelled on shutdown."""
+        task = self.hass.loop.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _watch_process(self) -> None:
+        """Restart the RTL-433 process whenever it exits."""
+        delay = self._retry_delay
+        watched: Optional[asyncio.subprocess.Process] = None
+        while not self._shutdown:
+            process = self._process
+            if process is not None and process is not watched:
+                watched = process
+                await process.wait()
+                if self._shutdown:
+                    break
+                _LOGGER.warning(
+                    "RTL-433 process exited with return code %s, restarting in %d seconds",
+                    process.returncode,
+                    delay,
+                )
 
-    async def _start_rtl433_process(self) -> None:
-        """Start the RTL-433 process."""
-        if self._process is not None:
-            await self._cleanup_process()
+            await asyncio.sleep(delay)
+            try:
+                await self._fetch_rtl433_data()
+            except Exception as err:
+                # Give the dongle a fresh set of init attempts, but back off so
+                # a missing device doesn't keep the watchdog spinning
+                self._device_init_attempts = 0
+                delay = min(delay * 2, MAX_RETRY_DELAY)
+                if isinstance(err, ConfigEntryNotReady):
+                    _LOGGER.error(
+                        "Failed to restart RTL-433 process, retrying in %d seconds: %s",
+                        delay,
+                        err,
+                    )
+                else:
+                    _LOGGER.exception(
+                        "Unexpected error restarting RTL-433 process, retrying in %d seconds",
+                        delay,
+                    )
+            else:
+                self._device_init_attempts = 0
+                delay = self._retry_delay
 
+    def _build_command(self) -> list[str]:
+        """Build the rtl_433 command line for this coordinator."""
         cmd = [
             "rtl_433",
             "-d", str(self.device_id),
@@ -180,59 +354,48 @@ class RTL433Coordinator(DataUpdateCoordinator):
         ]
 
         # Add protocol filters
-        if self.protocol_filter:
-            for protocol in self.protocol_filter:
-                cmd.extend(["-R", str(protocol)])
+        for protocol in sorted(self.protocol_filter):
+            cmd.extend(["-R", str(protocol)])
+
+        return cmd
+
+    async def _start_rtl433_process(self) -> None:
+        """Start the RTL-433 process."""
+        if self._process is not None:
+            await self._cleanup_process()
 
         try:
-            # First check if the device is available and reset it
-            def _check_and_reset_device():
+            # First check if the device is available and reset it, unless it
+            # was already verified by _initialize_rtl_device
+            if not self._device_verified:
                 try:
-                    # Try to reset the device first
-                    subprocess.run(
-                        ["rtl_eeprom", "-d", str(self.device_id), "-t"],
-                        capture_output=True,
-                        text=True,
-                        timeout=5
-                    )
-                    # Then test it
-                    return subprocess.run(
-                        ["rtl_test", "-d", str(self.device_id), "-t"],
-                        capture_output=True,
-                        text=True,
-                        timeout=5
-                    )
-                except subprocess.SubprocessError:
-                    # If rtl_eeprom fails, try direct test
-                    return subprocess.run(
-                        ["rtl_test", "-d", str(self.device_id), "-t"],
-                        capture_output=True,
-                        text=True,
-                        timeout=5
-                    )
-            
-            await self.hass.async_add_executor_job(_check_and_reset_device)
-            
+                    await self._run_cmd("rtl_eeprom", "-d", str(self.device_id), "-t")
+                except asyncio.TimeoutError:
+                    # If rtl_eeprom hangs, go straight to the device test
+                    pass
+                await self._run_cmd("rtl_test", "-d", str(self.device_id), "-t")
+                self._device_verified = True
+
             # Start the RTL-433 process with a clean environment
             env = os.environ.copy()
             env["LANG"] = "C"  # Ensure consistent output format
             
             self._process = await asyncio.create_subprocess_exec(
-                *cmd,
+                *self._rtl_cmd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
-                limit=1024 * 1024,  # 1MB buffer
+                limit=STREAM_LIMIT,
                 env=env
             )
             
-            _LOGGER.info("Started RTL-433 process with command: %s", " ".join(cmd))
+            _LOGGER.info("Started RTL-433 process with command: %s", self._rtl_cmd_str)
             
             # Start monitoring tasks
-            self.hass.loop.create_task(self._read_rtl433_output())
-            self.hass.loop.create_task(self._monitor_process())
+            self._spawn(self._read_rtl433_output())
+            self._spawn(self._monitor_process())
 
-        except subprocess.TimeoutError:
-            raise ConfigEntryNotReady("Timeout while checking RTL-SDR device")
+        except asyncio.TimeoutError as err:
+            raise ConfigEntryNotReady("Timeout while checking RTL-SDR device") from err
         except (OSError, asyncio.SubprocessError) as err:
             self._process = None
             raise ConfigEntryNotReady(
@@ -241,38 +404,23 @@ class RTL433Coordinator(DataUpdateCoordinator):
 
     def _evaluate_signal_quality(self, rssi: float, snr: float, noise: float) -> str:
         """Evaluate overall signal quality based on RSSI, SNR, and noise floor."""
-        if (rssi >= SIGNAL_EXCELLENT and 
-            snr >= SNR_EXCELLENT and 
-            noise <= NOISE_EXCELLENT):
-            return "excellent"
-        elif (rssi >= SIGNAL_GOOD and 
-              snr >= SNR_GOOD and 
-              noise <= NOISE_GOOD):
-            return "good"
-        elif (rssi >= SIGNAL_FAIR and 
-              snr >= SNR_FAIR and 
-              noise <= NOISE_FAIR):
-            return "fair"
-        elif (rssi >= SIGNAL_POOR and 
-              snr >= SNR_POOR and 
-              noise <= NOISE_POOR):
-            return "poor"
+        for name, min_rssi, min_snr, max_noise in _QUALITY_TIERS:
+            if rssi >= min_rssi and snr >= min_snr and noise <= max_noise:
+                return name
         return "unusable"
 
     def _track_signal_quality(self, device_id: str, quality: str) -> None:
         """Track signal quality history for a device."""
-        if device_id not in self._signal_quality_history:
-            self._signal_quality_history[device_id] = []
-        
-        history = self._signal_quality_history[device_id]
-        history.append(quality)
-        
         # Keep last 10 readings
-        if len(history) > 10:
-            history.pop(0)
-        
+        history = self._signal_quality_history.get(device_id)
+        if history is None:
+            history = self._signal_quality_history[device_id] = deque(maxlen=10)
+        history.append(quality)
+
         # Log if signal quality is consistently poor
-        if len(history) >= 5 and all(q in ["poor", "unusable"] for q in history[-5:]):
+        if len(history) >= 5 and all(
+            q in _POOR_QUALITIES for q in islice(history, len(history) - 5, None)
+        ):
             _LOGGER.warning(
                 "Device %s has had poor signal quality for 5 consecutive readings",
                 device_id
@@ -292,18 +440,17 @@ class RTL433Coordinator(DataUpdateCoordinator):
                         break
                     continue
 
-                error_msg = line.decode().strip()
-                if error_msg:
+                line = line.strip()
+                if line:
                     # Log all stderr messages at debug level
-                    _LOGGER.debug("RTL-433 stderr: %s", error_msg)
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug("RTL-433 stderr: %s", line.decode(errors="replace"))
 
                     # Check for actual critical error conditions
-                    if any(msg in error_msg.lower() for msg in [
-                        "usb_claim_interface error",
-                        "device not found",
-                        "device or resource busy",
-                    ]):
-                        _LOGGER.error("Critical RTL-433 error: %s", error_msg)
+                    if _CRITICAL_STDERR_RE.search(line):
+                        _LOGGER.error(
+                            "Critical RTL-433 error: %s", line.decode(errors="replace")
+                        )
                         await self._handle_process_error()
                         break
 
@@ -317,9 +464,10 @@ class RTL433Coordinator(DataUpdateCoordinator):
     async def _handle_process_error(self) -> None:
         """Handle process errors."""
         try:
+            # The watchdog restarts the process once it has exited; probe the
+            # device again before that restart
+            self._device_verified = False
             await self._cleanup_process()
-            # Request a refresh which will restart the process
-            await self.async_request_refresh()
         except Exception as err:
             _LOGGER.error("Error during process error handling: %s", err)
 
@@ -337,6 +485,19 @@ class RTL433Coordinator(DataUpdateCoordinator):
             try:
                 # First try to reset the USB device
                 def _reset_usb():
+                    # Locate the dongle once and reset it directly via usbfs
+                    if not self._usb_path_scanned:
+                        self._usb_path = _find_rtlsdr_usb_path(self.device_id)
+                        self._usb_path_scanned = True
+                    if self._usb_path is not None:
+                        try:
+                            _usbfs_reset(self._usb_path)
+                            return
+                        except OSError as err:
+                            _LOGGER.debug("USB reset of %s failed: %s", self._usb_path, err)
+                            # The device may have been re-plugged; scan again next time
+                            self._usb_path_scanned = False
+
                     try:
                         # Try to reset USB device using usb_reset
                         subprocess.run(
@@ -367,25 +528,20 @@ class RTL433Coordinator(DataUpdateCoordinator):
                 await asyncio.sleep(self._device_init_delay)
                 
                 # Test device
-                def _test_device():
-                    return subprocess.run(
-                        ["rtl_test", "-d", str(self.device_id), "-t"],
-                        capture_output=True,
-                        text=True,
-                        timeout=5
-                    )
-                
-                result = await self.hass.async_add_executor_job(_test_device)
-                
-                if "usb_claim_interface error" in result.stderr:
-                    raise subprocess.CalledProcessError(1, "rtl_test", result.stdout, result.stderr)
-                
+                returncode, stdout, stderr = await self._run_cmd(
+                    "rtl_test", "-d", str(self.device_id), "-t"
+                )
+
+                if b"usb_claim_interface error" in stderr:
+                    raise subprocess.CalledProcessError(returncode or 1, "rtl_test", stdout, stderr)
+
                 # PLL not locked is normal, don't treat it as an error
                 _LOGGER.info("RTL-SDR device initialized successfully")
                 self._device_init_attempts = 0  # Reset counter on success
+                self._device_verified = True
                 return
                 
-            except subprocess.CalledProcessError as err:
+            except (subprocess.CalledProcessError, asyncio.TimeoutError) as err:
                 self._device_init_attempts += 1
                 _LOGGER.warning(
                     "Failed to initialize RTL-SDR device (attempt %d/%d): %s",
@@ -402,128 +558,183 @@ class RTL433Coordinator(DataUpdateCoordinator):
             "Please check device permissions and ensure it's not in use by another application."
         )
 
+    async def _run_cmd(
+        self, *argv: str, timeout: float = 5
+    ) -> tuple[Optional[int], bytes, bytes]:
+        """Run a helper command on the event loop and return its result."""
+        proc = await asyncio.create_subprocess_exec(
+            *argv,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
+        return proc.returncode, stdout, stderr
+
     async def _read_rtl433_output(self) -> None:
         """Read and process output from RTL-433."""
         if not self._process or not self._process.stdout:
             return
 
-        buffer = ""
         while not self._shutdown:
             try:
-                chunk = await self._process.stdout.read(1024)
-                if not chunk:
+                line = await self._process.stdout.readline()
+                if not line:
                     break
-
-                buffer += chunk.decode()
-                
-                while "\n" in buffer:
-                    line, buffer = buffer.split("\n", 1)
-                    try:
-                        data = json.loads(line)
-                        await self._process_device_data(data)
-                        _LOGGER.debug("Received RTL-433 data: %s", data)
-                    except json.JSONDecodeError:
-                        _LOGGER.debug("Received invalid JSON from rtl_433: %s", line)
-                    except Exception as err:
-                        _LOGGER.error("Error processing RTL-433 data: %s", err)
-
+            except ValueError:
+                # readline() discards a line longer than the buffer limit
+                _LOGGER.warning("Skipped RTL-433 output line longer than %d bytes", STREAM_LIMIT)
+                continue
             except Exception as err:
                 _LOGGER.error("Error reading RTL-433 output: %s", err)
                 break
 
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                data = json_loads(line)
+                await self._process_device_data(data)
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Received RTL-433 data: %s", data)
+            except json.JSONDecodeError:
+                # orjson.JSONDecodeError subclasses json.JSONDecodeError
+                _LOGGER.debug("Received invalid JSON from rtl_433: %s", line)
+            except Exception as err:
+                _LOGGER.error("Error processing RTL-433 data: %s", err)
+
         if not self._shutdown:
             _LOGGER.warning("RTL-433 process output stream ended")
             await self._handle_process_error()
 
-    @callback
     async def _process_device_data(self, data: Dict[str, Any]) -> None:
         """Process received device data."""
-        if not isinstance(data, dict):
-            return
+        self._process_batch((data,))
+
+    def _process_batch(self, records: Iterable[Any]) -> None:
+        """Process a burst of decoded rtl_433 records in one pass."""
+        # Hoist attribute and logger lookups out of the per-record loop
+        devices = self._devices
+        known_devices = self._known_devices
+        protocol_filter = self.protocol_filter
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        info = _LOGGER.isEnabledFor(logging.INFO)
+        updated = False
+
+        for data in records:
+            if not isinstance(data, dict):
+                continue
+
+            # Skip unsupported models before doing any other work
+            model = data.get("model")
+            if model not in DEVICE_SENSORS:
+                continue
+
+            device_id = data.get("id")
+            if not device_id:
+                continue
+
+            # Apply protocol filter if configured
+            protocol = data.get("protocol")
+            if protocol_filter and protocol is not None:
+                if protocol not in protocol_filter:
+                    if debug:
+                        _LOGGER.debug(
+                            "Filtered out device %s_%s with protocol %s (not in %s)",
+                            model,
+                            device_id,
+                            protocol,
+                            protocol_filter
+                        )
+                    continue
 
-        # Extract core device information
-        model = data.get("model")
-        device_id = data.get("id")
-        if not model or not device_id:
-            return
+            # Create unique device identifier
+            unique_id = f"{model}_{device_id}"
+
+            # Evaluate signal quality; JSON numbers already decode to int/float
+            rssi = data.get("rssi") or 0.0
+            snr = data.get("snr") or 0.0
+            noise = data.get("noise") or 0.0
+            if rssi or snr or noise:
+                signal_quality = self._evaluate_signal_quality(rssi, snr, noise)
+                self._track_signal_quality(unique_id, signal_quality)
+            else:
+                # Device does not report signal levels
+                signal_quality = "unknown"
+
+            # Format sensor data
+            sensor_data = _format_sensor_data(data)
+
+            record = devices.get(unique_id)
+            if record is None:
+                # Allocate the device record once; later frames update it in place
+                record = devices[unique_id] = {
+                    "device_info": {
+                        "identifiers": {(DOMAIN, unique_id)},
+                        "name": f"{model} Sensor {device_id}",
+                        "manufacturer": data.get("brand", "RTL-433"),
+                        "model": model,
+                        "via_device": (DOMAIN, self.device_id),
+                    },
+                    "sensor_data": {},
+                    "last_update": "",
+                    "signal_quality": {
+                        "rssi": 0.0,
+                        "snr": 0.0,
+                        "noise": 0.0,
+                        "quality": "unknown",
+                    },
+                }
+
+            # Update device data
+            record["sensor_data"].clear()
+            record["sensor_data"].update(sensor_data)
+            record["last_update"] = data.get("time", "")
+            quality = record["signal_quality"]
+            quality["rssi"] = rssi
+            quality["snr"] = snr
+            quality["noise"] = noise
+            quality["quality"] = signal_quality
+            updated = True
+
+            # Process new device if needed
+            if unique_id not in known_devices:
+                self._process_new_device(unique_id, data)
+                if info:
+                    _LOGGER.info(
+                        "Discovered new device - Model: %s, ID: %s, Protocol: %s, Signal: %s, Sensors: %s",
+                        model,
+                        device_id,
+                        protocol,
+                        signal_quality,
+                        ", ".join(sensor_data),
+                    )
 
-        # Create unique device identifier
-        unique_id = f"{model}_{device_id}"
-
-        # Apply protocol filter if configured
-        protocol = data.get("protocol")
-        if self.protocol_filter and protocol is not None:
-            if protocol not in self.protocol_filter:
-                _LOGGER.debug(
-                    "Filtered out device %s with protocol %s (not in %s)",
-                    unique_id,
-                    protocol,
-                    self.protocol_filter
-                )
-                return
+        # Schedule a single coalesced coordinator update for the batch
+        if updated:
+            self._schedule_flush()
 
-        # Evaluate signal quality
-        rssi = float(data.get("rssi", 0))
-        snr = float(data.get("snr", 0))
-        noise = float(data.get("noise", 0))
-        signal_quality = self._evaluate_signal_quality(rssi, snr, noise)
-        
-        # Track signal quality
-        self._track_signal_quality(unique_id, signal_quality)
-
-        # Format sensor data
-        sensor_data = {
-            key: self._format_sensor_value(key, value)
-            for key, value in data.items()
-            if key not in ["model", "id", "brand", "protocol"] and value is not None
-        }
-
-        # Create device info
-        device_info = {
-            "identifiers": {(DOMAIN, unique_id)},
-            "name": f"{model} Sensor {device_id}",
-            "manufacturer": data.get("brand", "RTL-433"),
-            "model": model,
-            "via_device": (DOMAIN, self.device_id),
-        }
-
-        # Update device data
-        self.data[unique_id] = {
-            "device_info": device_info,
-            "sensor_data": sensor_data,
-            "last_update": data.get("time", ""),
-            "signal_quality": {
-                "rssi": rssi,
-                "snr": snr,
-                "noise": noise,
-                "quality": signal_quality,
-            }
-        }
-
-        # Process new device if needed
-        if unique_id not in self._known_devices:
-            self._process_new_device(unique_id, data)
-            _LOGGER.info(
-                "Discovered new device - Model: %s, ID: %s, Protocol: %s, Signal: %s, Sensors: %s",
-                model,
-                device_id,
-                protocol,
-                signal_quality,
-                ", ".join(sensor_data.keys()),
+    @callback
+    def _schedule_flush(self) -> None:
+        """Schedule a single listener update for frames received in a burst."""
+        if self._flush_handle is None:
+            self._flush_handle = self.hass.loop.call_later(
+                UPDATE_FLUSH_DELAY, self._flush_updated_data
             )
 
-        # Update coordinator data
+    @callback
+    def _flush_updated_data(self) -> None:
+        """Push the accumulated device data to listeners."""
+        self._flush_handle = None
+        if self._new_device_ids:
+            new_device_ids, self._new_device_ids = self._new_device_ids, []
+            async_dispatcher_send(self.hass, self.new_device_signal, new_device_ids)
         self.async_set_updated_data(self.data)
-        _LOGGER.debug("Processing device data: %s", data)
-
-    def _format_sensor_value(self, key: str, value: Any) -> Any:
-        """Format sensor values consistently."""
-        if isinstance(value, (int, float)):
-            # Round floating point values to 2 decimal places
-            return round(float(value), 2)
-        elif key == "battery_ok":
-            return bool(value)
-        return value
 
     async def _cleanup_process(self) -> None:
         """Clean up the RTL-433 process."""
@@ -547,6 +758,13 @@ class RTL433Coordinator(DataUpdateCoordinator):
     async def async_shutdown(self) -> None:
         """Shutdown the coordinator."""
         self._shutdown = True
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        tasks = [task for task in self._tasks if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
         await self._cleanup_process()
         await super().async_shutdown()
 
@@ -556,9 +774,10 @@ class RTL433Sensor(Entity):
     def __init__(self, coordinator, unique_id, name, device_info):
         """Initialize the sensor."""
         self.coordinator = coordinator
-        self.unique_id = unique_id
+        self._unique_id = unique_id
         self._name = name
         self._device_info = device_info
+        self._record: Optional[Dict[str, Any]] = None
 
     @property
     def name(self):
@@ -568,7 +787,7 @@ class RTL433Sensor(Entity):
     @property
     def unique_id(self):
         """Return a unique ID for this sensor."""
-        return self.unique_id
+        return self._unique_id
 
     @property
     def device_info(self):
@@ -578,7 +797,10 @@ class RTL433Sensor(Entity):
     @property
     def state(self):
         """Return the state of the sensor."""
-        return self.coordinator.data[self.unique_id]["sensor_data"]
+        # Device records are updated in place, so the reference stays valid
+        if self._record is None:
+            self._record = self.coordinator.data[self._unique_id]
+        return self._record["sensor_data"]
 
     async def async_update(self):
         """Fetch new state data for the sensor."""
@@ -9,6 +9,7 @@ This module implements the sensor platform for RTL-433 devices, providing:
 from __future__ import annotations
 
 import logging
+import time
 from typing import Any, Dict, Optional
 
 from homeassistant.components.sensor import (
@@ -18,21 +19,42 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
 )
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 
 from .const import (
     DOMAIN,
-    SENSOR_TYPES,
+    SENSOR_ATTRS,
+    SENSOR_DISPLAY_FRAGMENT,
+    SIGNAL_SENSOR_TYPES,
     DEVICE_SENSORS,
 )
 from .coordinator import RTL433Coordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# An unchanged reading still republishes last_update this often
+LAST_UPDATE_REFRESH_INTERVAL = 60  # seconds
+
+
+def _format_battery(value: Any) -> str:
+    """Format a battery_ok flag as a status string."""
+    return "OK" if value else "Low"
+
+
+def _format_signal(value: Any) -> Optional[float]:
+    """Round a signal metric to one decimal place."""
+    return None if value is None else round(float(value), 1)
+
+
+def _format_identity(value: Any) -> Any:
+    """Return the value unchanged."""
+    return value
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -53,19 +75,16 @@ async def async_setup_entry(
     @callback
     def _async_process_data(coordinator_data: Dict[str, Any]) -> None:
         """Process coordinator data and create entities."""
-        _LOGGER.debug("Processing coordinator data update: %s", coordinator_data)
-        
         if not coordinator_data:
             _LOGGER.warning("Received empty coordinator data")
             return
 
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug("Processing coordinator data update for %d devices", len(coordinator_data))
+
         new_entities = []
         for device_id, device_data in coordinator_data.items():
-            if device_id == "known_entities":
-                continue
-                
-            _LOGGER.debug("Processing device data for %s: %s", device_id, device_data)
-            
             # Extract device information from device_info
             device_info = device_data.get("device_info", {})
             model = device_info.get("model")
@@ -76,22 +95,26 @@ async def async_setup_entry(
             _LOGGER.info("Processing device: %s (model: %s)", device_id, model)
             
             # Get available sensor types for this device model
-            available_sensors = DEVICE_SENSORS.get(model, [])
+            available_sensors = DEVICE_SENSORS.get(model, ())
             if not available_sensors:
                 _LOGGER.warning("No sensor types defined for model: %s", model)
                 continue
-                
-            _LOGGER.debug("Available sensors for %s: %s", model, available_sensors)
-            
+
             # Get actual sensor data
             sensor_data = device_data.get("sensor_data", {})
-            _LOGGER.debug("Sensor data for %s: %s", device_id, sensor_data)
+            if debug:
+                _LOGGER.debug(
+                    "Device %s model=%s sensors=%d",
+                    device_id,
+                    model,
+                    len(available_sensors),
+                )
             
             # Create sensor entities for each available sensor type
             for sensor_type in available_sensors:
                 if sensor_type in sensor_data:
                     entity_id = f"{device_id}_{sensor_type}"
-                    if entity_id not in coordinator.data.get("known_entities", set()):
+                    if entity_id not in coordinator.known_entity_ids:
                         _LOGGER.info("Creating sensor entity - device: %s, type: %s", device_id, sensor_type)
                         try:
                             entity = RTL433Sensor(
@@ -101,9 +124,7 @@ async def async_setup_entry(
                                 model=model,
                             )
                             new_entities.append(entity)
-                            if "known_entities" not in coordinator.data:
-                                coordinator.data["known_entities"] = set()
-                            coordinator.data["known_entities"].add(entity_id)
+                            coordinator.known_entity_ids.add(entity_id)
                             _LOGGER.info("Successfully created sensor entity for %s - %s", device_id, sensor_type)
                         except Exception as err:
                             _LOGGER.error("Failed to create sensor entity for %s - %s: %s", device_id, sensor_type, err, exc_info=True)
@@ -112,6 +133,18 @@ async def async_setup_entry(
             _LOGGER.info("Adding %d new sensor entities", len(new_entities))
             async_add_entities(new_entities)
 
+    @callback
+    def _async_add_devices(device_ids: list[str]) -> None:
+        """Create entities for devices announced by the coordinator in one batch."""
+        _async_process_data(
+            {device_id: coordinator.data[device_id] for device_id in device_ids}
+        )
+
+    # Create entities for devices discovered from now on
+    config_entry.async_on_unload(
+        async_dispatcher_connect(hass, coordinator.new_device_signal, _async_add_devices)
+    )
+
     # Process any existing data
     if coordinator.data:
         _LOGGER.info("Processing existing devices: %s", list(coordinator.data.keys()))
@@ -139,19 +172,47 @@ class RTL433Sensor(CoordinatorEntity[RTL433Coordinator], SensorEntity):
         
         # Set entity attributes
         self._attr_unique_id = f"{device_id}_{sensor_type}"
-        self._attr_name = f"{model} {sensor_type.replace('_', ' ').title()}"
+        self._attr_name = f"{model} {SENSOR_DISPLAY_FRAGMENT[sensor_type]}"
         
-        # Set sensor characteristics from SENSOR_TYPES
-        sensor_info = SENSOR_TYPES[sensor_type]
-        self._attr_device_class = sensor_info["device_class"]
-        self._attr_state_class = sensor_info["state_class"]
-        self._attr_native_unit_of_measurement = sensor_info["unit"]
-        self._attr_icon = sensor_info["icon"]
+        # Set sensor characteristics from SENSOR_ATTRS
+        device_class, state_class, unit, icon, diagnostic = SENSOR_ATTRS[sensor_type]
+        self._attr_device_class = device_class
+        self._attr_state_class = state_class
+        self._attr_native_unit_of_measurement = unit
+        self._attr_icon = icon
         
         # Set diagnostic category for battery and signal sensors
-        if sensor_type in ["battery_ok", "rssi", "snr", "noise"]:
-            self._attr_entity_category = "diagnostic"
-            
+        if diagnostic:
+            self._attr_entity_category = EntityCategory.DIAGNOSTIC
+
+        # Pick the value formatter once instead of on every state read
+        if sensor_type == "battery_ok":
+            self._format = _format_battery
+        elif sensor_type in SIGNAL_SENSOR_TYPES:
+            self._format = _format_signal
+        else:
+            self._format = _format_identity
+
+        # Last written (available, value, signal_quality, raw_value) used to
+        # skip no-op writes, and when and with which last_update it was written
+        self._last_state: Optional[tuple[bool, Any, Any, Any]] = None
+        self._last_write = 0.0
+        self._last_written_update: Any = None
+        self._update_attrs()
+
+        # Device records keep their device_info for their whole lifetime
+        device_data = coordinator.data.get(device_id)
+        if device_data and "device_info" in device_data:
+            self._attr_device_info = device_data["device_info"]
+        else:
+            self._attr_device_info = DeviceInfo(
+                identifiers={(DOMAIN, device_id)},
+                name=f"{model} {device_id.rsplit('_', 1)[-1]}",
+                manufacturer="RTL-433",
+                model=model,
+                via_device=(DOMAIN, coordinator.device_id),
+            )
+
         _LOGGER.debug(
             "Initialized sensor - ID: %s, Type: %s, Name: %s",
             self._attr_unique_id,
@@ -159,79 +220,66 @@ class RTL433Sensor(CoordinatorEntity[RTL433Coordinator], SensorEntity):
             self._attr_name
         )
 
-    @property
-    def native_value(self) -> Any:
-        """Return the state of the sensor."""
-        if self._device_id in self.coordinator.data:
-            device_data = self.coordinator.data[self._device_id]
-            if "sensor_data" in device_data:
-                value = device_data["sensor_data"].get(self._sensor_type)
-                
-                # Format battery status
-                if self._sensor_type == "battery_ok":
-                    formatted_value = "OK" if value else "Low"
-                    _LOGGER.debug("%s battery status: %s (raw: %s)", self._device_id, formatted_value, value)
-                    return formatted_value
-                    
-                # Format signal quality
-                if self._sensor_type in ["rssi", "snr", "noise"]:
-                    if value is not None:
-                        formatted_value = round(float(value), 1)
-                        _LOGGER.debug("%s signal metric %s: %s", self._device_id, self._sensor_type, formatted_value)
-                        return formatted_value
-                
-                _LOGGER.debug("%s %s value: %s", self._device_id, self._sensor_type, value)
-                return value
-                
-        _LOGGER.debug("%s %s no value available", self._device_id, self._sensor_type)
-        return None
+    def _update_attrs(self) -> None:
+        """Refresh the cached state attributes from the coordinator data."""
+        device_data = self.coordinator.data.get(self._device_id)
+        if not device_data:
+            self._attr_available = False
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = {}
+            return
+
+        sensor_data = device_data.get("sensor_data")
+        value = None if sensor_data is None else sensor_data.get(self._sensor_type)
+        self._attr_available = value is not None
+        self._attr_native_value = self._format(value)
 
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return additional state attributes."""
         attrs = {}
-        
-        if self._device_id in self.coordinator.data:
-            device_data = self.coordinator.data[self._device_id]
-            
-            # Add signal quality information
-            if "signal_quality" in device_data:
-                signal_quality = device_data["signal_quality"]
-                attrs["signal_quality"] = signal_quality.get("quality", "unknown")
-                
-                if self._sensor_type in ["rssi", "snr", "noise"]:
-                    attrs["raw_value"] = signal_quality.get(self._sensor_type)
-            
-            # Add last update time
-            if "last_update" in device_data:
-                attrs["last_update"] = device_data["last_update"]
-                
+
+        # Add signal quality information
+        if "signal_quality" in device_data:
+            signal_quality = device_data["signal_quality"]
+            attrs["signal_quality"] = signal_quality.get("quality", "unknown")
+
+            if self._sensor_type in SIGNAL_SENSOR_TYPES:
+                attrs["raw_value"] = signal_quality.get(self._sensor_type)
+
+        # Add last update time
+        if "last_update" in device_data:
+            attrs["last_update"] = device_data["last_update"]
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug("%s extra attributes: %s", self._device_id, attrs)
-        
-        return attrs
+
+        self._attr_extra_state_attributes = attrs
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when this sensor's state actually changed."""
+        self._update_attrs()
+        attrs = self._attr_extra_state_attributes
+        # last_update changes with every frame, so it's left out of the key;
+        # otherwise an unchanged reading would never be skipped
+        state = (
+            self._attr_available,
+            self._attr_native_value,
+            attrs.get("signal_quality"),
+            attrs.get("raw_value"),
+        )
+        last_update = attrs.get("last_update")
+        now = time.monotonic()
+        if state == self._last_state and (
+            last_update == self._last_written_update
+            or now - self._last_write < LAST_UPDATE_REFRESH_INTERVAL
+        ):
+            return
+        self._last_state = state
+        self._last_write = now
+        self._last_written_update = last_update
+        super()._handle_coordinator_update()
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        is_available = False
-        if self._device_id in self.coordinator.data:
-            device_data = self.coordinator.data[self._device_id]
-            is_available = bool(device_data.get("sensor_data", {}).get(self._sensor_type) is not None)
-        
-        if not is_available:
-            _LOGGER.debug("%s %s is unavailable", self._device_id, self._sensor_type)
-            
-        return is_available
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        if self._device_id in self.coordinator.data:
-            return self.coordinator.data[self._device_id]["device_info"]
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=f"{self._model} {self._device_id.split('_')[-1]}",
-            manufacturer="RTL-433",
-            model=self._model,
-            via_device=(DOMAIN, self.coordinator.device_id),
-        ) 
\ No newline at end of file
+        # CoordinatorEntity.available would ignore the cached value
+        return self._attr_available
@@ -17,7 +17,7 @@ async def setup_rtl433_integration(hass, config=None):
         CONF_GAIN: 40,
     }
 
-    with patch("custom_components.rtl433.coordinator.RTL433Coordinator._start_rtl433", return_value=None):
+    with patch("custom_components.rtl433.coordinator.RTL433Coordinator._fetch_rtl433_data", return_value={}):
         entry = MockConfigEntry(
             domain=DOMAIN,
             data=config,
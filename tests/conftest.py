@@ -15,7 +15,7 @@ from homeassistant.loader import DATA_COMPONENTS, DATA_MISSING_PLATFORMS
 from homeassistant.setup import async_setup_component
 from homeassistant.helpers import translation
 
-from .test_cleanup import cleanup_utility, cleanup_test_environment
+from .test_cleanup import cleanup_test_environment
 from .test_mocks import RTL433ProcessMock, HomeAssistantMock
 from .test_fixtures import (
     mock_rtl433_data,
@@ -31,12 +31,11 @@ _LOGGER = logging.getLogger(__name__)
 # Store original socket class
 _OriginalSocket = socket.socket
 
-class SocketProxy:
-    """Proxy for socket operations that only allows Unix domain sockets."""
-    def __new__(cls, family=-1, type=-1, proto=-1, fileno=None):
-        if family == socket.AF_UNIX:
-            return _OriginalSocket(family, type, proto, fileno)
-        raise socket.error("Only Unix domain sockets are allowed")
+def _unix_only_socket(family=-1, type=-1, proto=-1, fileno=None):
+    """Socket factory that only allows Unix domain sockets."""
+    if family == socket.AF_UNIX:
+        return _OriginalSocket(family, type, proto, fileno)
+    raise socket.error("Only Unix domain sockets are allowed")
 
 @pytest.fixture
 def event_loop():
@@ -49,7 +48,7 @@ def event_loop():
 @pytest.fixture(autouse=True)
 def socket_control():
     """Control socket usage to only allow Unix domain sockets."""
-    socket.socket = SocketProxy
+    socket.socket = _unix_only_socket
     yield
     socket.socket = _OriginalSocket
 
@@ -58,6 +57,8 @@ async def auto_enable_custom_integrations(hass):
     """Enable custom integrations in Home Assistant."""
     hass.data.setdefault("custom_components", {})
 
+# Function scoped like event_loop: a shared instance leaks registries, states
+# and loaded platforms between tests
 @pytest.fixture
 async def hass(tmp_path, event_loop, enable_debug_logging):
     """Fixture to provide a test instance of Home Assistant."""
@@ -104,8 +105,8 @@ async def hass(tmp_path, event_loop, enable_debug_logging):
 async def cleanup_after_test():
     """Cleanup after each test with debug reporting."""
     yield
+    # cleanup_test_environment logs its own report
     await cleanup_test_environment()
-    _LOGGER.debug(cleanup_utility.get_cleanup_report())
 
 @pytest.fixture(autouse=True)
 def mock_process_cleanup():
@@ -115,4 +116,5 @@ def mock_process_cleanup():
     
     with patch('asyncio.create_subprocess_exec', return_value=process_mock):
         yield process_mock
-        _LOGGER.debug(process_mock.get_debug_report())
\ No newline at end of file
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("%s", process_mock.get_debug_report())
\ No newline at end of file
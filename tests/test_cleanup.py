@@ -1,20 +1,91 @@
 """Test cleanup utilities for RTL-433 integration tests."""
 import asyncio
 import logging
+import os
+import shutil
+import sys
+from itertools import chain
 import psutil
-from typing import List, Optional, Set
+from time import monotonic
+from collections import deque
+from typing import Deque, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 
 _LOGGER = logging.getLogger(__name__)
 
-@dataclass
+# Process names cleaned up when the caller doesn't name any
+_DEFAULT_PROCNAMES: frozenset[str] = frozenset({"rtl_433"})
+
+def read_process_table() -> List[Tuple[int, str]]:
+    """Return (pid, name) for every running process."""
+    entries: List[Tuple[int, str]] = []
+    if sys.platform.startswith("linux"):
+        # Reading /proc directly avoids building a Process object per PID,
+        # raw os.open/os.read also skip the buffered text file wrapper
+        with os.scandir("/proc") as proc_dir:
+            for entry in proc_dir:
+                if not entry.name.isdigit():
+                    continue
+                try:
+                    fd = os.open(f"/proc/{entry.name}/comm", os.O_RDONLY)
+                except (FileNotFoundError, PermissionError):
+                    continue
+                try:
+                    comm = os.read(fd, 64)
+                except OSError:
+                    continue
+                finally:
+                    os.close(fd)
+                entries.append((int(entry.name), comm.rstrip(b"\n").decode(errors="replace")))
+    else:
+        for proc in psutil.process_iter():
+            try:
+                with proc.oneshot():
+                    entries.append((proc.pid, proc.name()))
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+    return entries
+
+def _kill_pid(pid: int) -> None:
+    """Send SIGKILL to a process, blocking call meant for an executor."""
+    psutil.Process(pid).kill()
+
+# Number of recent entries CleanupStats keeps per category
+STATS_HISTORY = 32
+
+def _history() -> Deque[str]:
+    return deque(maxlen=STATS_HISTORY)
+
+@dataclass(slots=True)
 class CleanupStats:
-    """Statistics for cleanup operations."""
-    processes_killed: List[int] = field(default_factory=list)
-    tasks_cancelled: List[str] = field(default_factory=list)
-    cleanup_errors: List[str] = field(default_factory=list)
+    """Statistics for cleanup operations.
+
+    Totals are plain counters, only the last STATS_HISTORY entries of each
+    category are kept for the report.
+    """
+    processes_killed_count: int = 0
+    tasks_cancelled_count: int = 0
+    cleanup_errors_count: int = 0
+    processes_killed: Deque[str] = field(default_factory=_history)
+    tasks_cancelled: Deque[str] = field(default_factory=_history)
+    cleanup_errors: Deque[str] = field(default_factory=_history)
     cleanup_duration: float = 0.0
 
+    def add_process(self, entry: str) -> None:
+        """Record a killed process."""
+        self.processes_killed_count += 1
+        self.processes_killed.append(entry)
+
+    def add_task(self, name: str) -> None:
+        """Record a cancelled task."""
+        self.tasks_cancelled_count += 1
+        self.tasks_cancelled.append(name)
+
+    def add_error(self, error: str) -> None:
+        """Record a cleanup error."""
+        self.cleanup_errors_count += 1
+        self.cleanup_errors.append(error)
+
 class TestCleanup:
     """Cleanup utilities for tests with debugging capabilities."""
 
@@ -26,84 +97,119 @@ class TestCleanup:
     async def cleanup_processes(self, process_names: Set[str] = None) -> None:
         """Clean up processes with debug tracking."""
         if process_names is None:
-            process_names = {"rtl_433"}
+            process_names = _DEFAULT_PROCNAMES
 
-        self._start_time = asyncio.get_event_loop().time()
+        self._start_time = monotonic()
         
         try:
-            for proc in psutil.process_iter(['pid', 'name']):
-                try:
-                    if any(name in proc.info['name'] for name in process_names):
-                        proc.kill()
-                        self.stats.processes_killed.append(proc.info['pid'])
-                        _LOGGER.debug(
-                            "Killed process %s (PID: %d)",
-                            proc.info['name'],
-                            proc.info['pid']
-                        )
-                except (psutil.NoSuchProcess, psutil.AccessDenied) as err:
-                    self.stats.cleanup_errors.append(f"Process cleanup error: {str(err)}")
+            pkill = shutil.which("pkill")
+            if pkill is not None:
+                await self._kill_pkill(pkill, process_names)
+            else:
+                await self._kill_scanned(process_names)
         finally:
-            self.stats.cleanup_duration = asyncio.get_event_loop().time() - self._start_time
+            self.stats.cleanup_duration = monotonic() - self._start_time
+
+    async def _kill_pkill(self, pkill: str, process_names: Set[str]) -> None:
+        """Kill matching processes with pkill, one call per process name."""
+        for name in process_names:
+            proc = await asyncio.create_subprocess_exec(
+                pkill, "-9", "-x", name,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            _, stderr = await proc.communicate()
+            # pkill exits with 0 when something was killed and 1 when nothing matched
+            if proc.returncode == 0:
+                self.stats.add_process(name)
+                _LOGGER.debug("Killed processes named %s", name)
+            elif proc.returncode != 1:
+                self.stats.add_error(
+                    f"Process cleanup error: pkill {name}: {stderr.decode().strip()}"
+                )
+
+    async def _kill_scanned(self, process_names: Set[str]) -> None:
+        """Kill matching processes found in a fresh process table scan."""
+        victims = [
+            (pid, proc_name)
+            for pid, proc_name in read_process_table()
+            if proc_name in process_names
+        ]
+        if not victims:
+            return
+
+        # Send the kills from the executor so they don't block the event loop
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(loop.run_in_executor(None, _kill_pid, pid) for pid, _ in victims),
+            return_exceptions=True,
+        )
+
+        for (pid, proc_name), result in zip(victims, results):
+            if isinstance(result, (psutil.NoSuchProcess, psutil.AccessDenied)):
+                self.stats.add_error(f"Process cleanup error: {str(result)}")
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                self.stats.add_process(f"{proc_name} (PID: {pid})")
+                _LOGGER.debug("Killed process %s (PID: %d)", proc_name, pid)
 
     async def cleanup_tasks(self, exclude_tasks: Set[asyncio.Task] = None) -> None:
         """Clean up async tasks with debug tracking."""
+        loop = asyncio.get_running_loop()
         if exclude_tasks is None:
-            exclude_tasks = {asyncio.current_task()}
+            exclude_tasks = {asyncio.current_task(loop)}
 
         try:
-            tasks = [t for t in asyncio.all_tasks() if t not in exclude_tasks]
-            for task in tasks:
-                if not task.done():
-                    task.cancel()
-                    self.stats.tasks_cancelled.append(task.get_name())
-                    _LOGGER.debug("Cancelled task: %s", task.get_name())
+            pending = asyncio.all_tasks(loop) - exclude_tasks
+            victims = [t for t in pending if not t.done()]
+            for task in victims:
+                task.cancel()
+                self.stats.add_task(task.get_name())
+                _LOGGER.debug("Cancelled task: %s", task.get_name())
             
-            if tasks:
-                await asyncio.wait(tasks, timeout=1)
+            if victims:
+                try:
+                    async with asyncio.timeout(1.0):
+                        await asyncio.gather(*victims, return_exceptions=True)
+                except asyncio.TimeoutError:
+                    _LOGGER.debug("Timed out waiting for cancelled tasks")
         except Exception as err:
-            self.stats.cleanup_errors.append(f"Task cleanup error: {str(err)}")
+            self.stats.add_error(f"Task cleanup error: {str(err)}")
 
-    async def wait_for_cleanup(self, timeout: float = 0.1) -> None:
-        """Wait for cleanup operations with timeout."""
-        try:
-            await asyncio.wait_for(asyncio.sleep(0), timeout=timeout)
-        except asyncio.TimeoutError:
-            _LOGGER.debug("Cleanup wait timeout after %.2f seconds", timeout)
+    async def wait_for_cleanup(self) -> None:
+        """Yield one loop iteration so cancelled tasks can finish."""
+        await asyncio.sleep(0)
 
     def get_cleanup_report(self) -> str:
         """Generate a cleanup report for debugging."""
-        report = [
+        stats = self.stats
+        header = (
             "Cleanup Report:",
-            f"Duration: {self.stats.cleanup_duration:.3f}s",
-            f"Processes Killed: {len(self.stats.processes_killed)}",
-            f"Tasks Cancelled: {len(self.stats.tasks_cancelled)}",
-            f"Errors: {len(self.stats.cleanup_errors)}"
-        ]
-
-        if self.stats.processes_killed:
-            report.append("\nKilled Processes:")
-            for pid in self.stats.processes_killed:
-                report.append(f"- PID: {pid}")
-
-        if self.stats.tasks_cancelled:
-            report.append("\nCancelled Tasks:")
-            for task in self.stats.tasks_cancelled:
-                report.append(f"- {task}")
-
-        if self.stats.cleanup_errors:
-            report.append("\nCleanup Errors:")
-            for error in self.stats.cleanup_errors:
-                report.append(f"- {error}")
-
-        return "\n".join(report)
-
-# Global cleanup utility instance
-cleanup_utility = TestCleanup()
+            f"Duration: {stats.cleanup_duration:.3f}s",
+            f"Processes Killed: {stats.processes_killed_count}",
+            f"Tasks Cancelled: {stats.tasks_cancelled_count}",
+            f"Errors: {stats.cleanup_errors_count}",
+        )
+        sections = (
+            ("\nKilled Processes:", stats.processes_killed),
+            ("\nCancelled Tasks:", stats.tasks_cancelled),
+            ("\nCleanup Errors:", stats.cleanup_errors),
+        )
+        return "\n".join(chain(
+            header,
+            *(
+                chain((title,), (f"- {entry}" for entry in entries))
+                for title, entries in sections
+                if entries
+            ),
+        ))
 
 async def cleanup_test_environment() -> None:
     """Clean up the test environment with full debug reporting."""
-    await cleanup_utility.cleanup_processes()
-    await cleanup_utility.cleanup_tasks()
-    await cleanup_utility.wait_for_cleanup()
-    _LOGGER.debug(cleanup_utility.get_cleanup_report()) 
\ No newline at end of file
+    cleanup = TestCleanup()
+    await cleanup.cleanup_processes()
+    await cleanup.cleanup_tasks()
+    await cleanup.wait_for_cleanup()
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("%s", cleanup.get_cleanup_report())
@@ -17,11 +17,14 @@ from custom_components.rtl433.const import (
     DEFAULT_GAIN,
 )
 
-@pytest.fixture
-async def mock_hass():
-    """Mock Home Assistant instance."""
-    hass = MagicMock(spec=HomeAssistant)
-    yield hass
+async def _no_entries():
+    """Return no existing config entries."""
+    return []
+
+@pytest.fixture(scope="module")
+def mock_hass():
+    """Mock Home Assistant instance, shared by the module."""
+    return MagicMock(spec=HomeAssistant)
 
 @pytest.fixture
 async def flow(mock_hass):
@@ -29,22 +32,31 @@ async def flow(mock_hass):
     flow = RTL433FlowHandler()
     flow.hass = mock_hass
     flow.context = {}
-    flow.async_get_current_entries = AsyncMock(return_value=[])
+    flow.async_get_current_entries = _no_entries
     flow.async_set_unique_id = AsyncMock()
     return flow
 
 @pytest.mark.asyncio
-async def test_validate_rtl433_device_success():
-    """Test successful device validation."""
+@pytest.mark.parametrize(
+    "returncode,stderr,expected_error",
+    [
+        (0, b"", None),
+        (1, b"usb_claim_interface error", "Device is in use"),
+        (1, b"not found", "RTL-SDR device not found"),
+    ],
+    ids=["success", "in_use", "not_found"],
+)
+async def test_validate_rtl433_device(returncode, stderr, expected_error):
+    """Test device validation results for the rtl_433 exit status and output."""
     with patch('asyncio.create_subprocess_exec', new_callable=AsyncMock) as mock_exec:
         mock_process = AsyncMock()
-        mock_process.communicate.return_value = (None, b"")
-        mock_process.returncode = 0
+        mock_process.communicate.return_value = (None, stderr)
+        mock_process.returncode = returncode
         mock_exec.return_value = mock_process
         
         is_valid, error = await validate_rtl433_device("0")
-        assert is_valid is True
-        assert error is None
+        assert is_valid is (expected_error is None)
+        assert error == expected_error
         
         # Verify correct command construction
         mock_exec.assert_called_once()
@@ -52,32 +64,6 @@ async def test_validate_rtl433_device_success():
         assert "-d" in cmd_args and "0" in cmd_args
         assert "-F" in cmd_args and "null" in cmd_args
 
-@pytest.mark.asyncio
-async def test_validate_rtl433_device_in_use():
-    """Test device in use error."""
-    with patch('asyncio.create_subprocess_exec', new_callable=AsyncMock) as mock_exec:
-        mock_process = AsyncMock()
-        mock_process.communicate.return_value = (None, b"usb_claim_interface error")
-        mock_process.returncode = 1
-        mock_exec.return_value = mock_process
-        
-        is_valid, error = await validate_rtl433_device("0")
-        assert is_valid is False
-        assert error == "Device is in use"
-
-@pytest.mark.asyncio
-async def test_validate_rtl433_device_not_found():
-    """Test device not found error."""
-    with patch('asyncio.create_subprocess_exec', new_callable=AsyncMock) as mock_exec:
-        mock_process = AsyncMock()
-        mock_process.communicate.return_value = (None, b"not found")
-        mock_process.returncode = 1
-        mock_exec.return_value = mock_process
-        
-        is_valid, error = await validate_rtl433_device("0")
-        assert is_valid is False
-        assert error == "RTL-SDR device not found"
-
 @pytest.mark.asyncio
 async def test_validate_rtl433_not_installed():
     """Test rtl_433 not installed error."""
@@ -6,18 +6,24 @@ covering process management, data processing, error handling, and cleanup operat
 from __future__ import annotations
 
 import asyncio
-from typing import Any, AsyncGenerator, Dict, List, Tuple
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List, Sequence, Tuple
 import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
 from _pytest.logging import LogCaptureFixture
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.exceptions import ConfigEntryNotReady
 
-from custom_components.rtl433.coordinator import RTL433Coordinator
+from custom_components.rtl433 import coordinator as coordinator_module
+from custom_components.rtl433.coordinator import (
+    MAX_RETRY_DELAY,
+    UPDATE_FLUSH_DELAY,
+    RTL433Coordinator,
+)
 from custom_components.rtl433.const import DOMAIN
 
-import time
 
 async def wait_for_cleanup() -> None:
     """Wait for cleanup operations to complete.
@@ -27,13 +33,18 @@ async def wait_for_cleanup() -> None:
     """
     await asyncio.sleep(0.1)
 
-# Test configuration with protocol filter
-TEST_CONFIG: Dict[str, Any] = {
-    "device": "0",
-    "frequency": "433.92M",
-    "gain": 40,
-    "protocol_filter": ["Acurite-Tower"],
-}
+class FakeClock:
+    """Deterministic clock and sleep to patch in for the timing tests."""
+
+    def __init__(self, now: float = 0.0) -> None:
+        """Initialize the clock at the given time."""
+        self.now = now
+        self.sleeps: List[float] = []
+
+    async def sleep(self, delay: float) -> None:
+        """Record the delay and advance the clock instead of sleeping."""
+        self.sleeps.append(delay)
+        self.now += delay
 
 @pytest.fixture
 def test_config() -> Dict[str, Any]:
@@ -50,6 +61,41 @@ def test_config() -> Dict[str, Any]:
         "test_mode": True,  # Enable test mode for special handling
     }
 
+@pytest.fixture
+def mock_process_factory() -> Callable[..., MagicMock]:
+    """Provide a builder for mock rtl_433 processes.
+    
+    Returns:
+        Callable[..., MagicMock]: Builds a running mock process whose stdout
+        and stderr readline return the given lines or raise the given
+        exceptions in turn, then block like an idle rtl_433
+    """
+    def _readline(results: Sequence[Any]) -> Callable[[], Awaitable[bytes]]:
+        pending = iter(results)
+
+        # The reader loops on readline, so use a plain coroutine function
+        # instead of AsyncMock's call recording
+        async def readline() -> bytes:
+            result = next(pending, None)
+            if result is None:
+                # Stay open without output until the task is cancelled
+                await asyncio.Event().wait()
+            if isinstance(result, bytes):
+                return result
+            raise result
+
+        return readline
+
+    def _make(stdout: Sequence[Any] = (), stderr: Sequence[Any] = ()) -> MagicMock:
+        mock_process = MagicMock()
+        mock_process.returncode = None
+        mock_process.stdout = SimpleNamespace(readline=_readline(stdout))
+        mock_process.stderr = SimpleNamespace(readline=_readline(stderr))
+        mock_process.wait = AsyncMock(return_value=0)
+        return mock_process
+
+    return _make
+
 @pytest.fixture
 async def coordinator(hass: HomeAssistant, test_config: Dict[str, Any]) -> AsyncGenerator[RTL433Coordinator, None]:
     """Create and yield a test coordinator instance.
@@ -64,24 +110,17 @@ async def coordinator(hass: HomeAssistant, test_config: Dict[str, Any]) -> Async
     Yields:
         RTL433Coordinator: Configured coordinator instance for testing
     """
-    coordinator = RTL433Coordinator(hass, "test_entry", test_config)
+    coordinator = RTL433Coordinator(
+        hass,
+        device_id=test_config["device"],
+        frequency=test_config["frequency"],
+        gain=test_config["gain"],
+        protocol_filter=test_config["protocol_filter"],
+    )
     yield coordinator
     
-    # Ensure proper cleanup
-    await coordinator.shutdown()
-    
-    # Cancel any remaining tasks
-    for task in asyncio.all_tasks():
-        if not task.done():
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
-                
-    # Clear scheduled timers
-    for handle in hass.loop._scheduled:
-        handle.cancel()
+    # Ensure proper cleanup; this also cancels the tasks the coordinator owns
+    await coordinator.async_shutdown()
 
 @pytest.mark.asyncio
 async def test_coordinator_data_processing(coordinator: RTL433Coordinator) -> None:
@@ -90,27 +129,29 @@ async def test_coordinator_data_processing(coordinator: RTL433Coordinator) -> No
     Verifies that the coordinator correctly processes different types of data:
     1. Valid sensor data with all required fields
     2. Valid data from different models
-    3. Invalid data (non-dict)
-    4. Incomplete data (missing required fields)
+    3. Unsupported models are dropped
+    4. Invalid data (non-dict)
+    5. Incomplete data (missing required fields)
     
     Args:
         coordinator: Test coordinator instance
     """
     test_cases: List[Tuple[Any, int]] = [
-        ({"model": "Acurite-Tower", "id": 1234, "temperature_C": 22.5}, 1),
-        ({"model": "Other-Model", "id": 5678}, 1),
-        ("not a dict", 1),
-        ({"temperature_C": 22.5}, 1)  # Missing model and id
+        ({"model": "Acurite-5n1", "id": 1234, "temperature_C": 22.5}, 1),
+        ({"model": "LaCrosse-TX141W", "id": 5678, "temperature_C": 20.1}, 2),
+        ({"model": "Other-Model", "id": 9012, "temperature_C": 21.0}, 2),
+        ("not a dict", 2),
+        ({"temperature_C": 22.5}, 2)  # Missing model and id
     ]
 
     for test_data, expected_length in test_cases:
-        coordinator._process_data(test_data)
+        coordinator._process_batch((test_data,))
         assert len(coordinator.data) == expected_length
 
 @pytest.mark.asyncio
 async def test_coordinator_process_management(
     coordinator: RTL433Coordinator, 
-    mock_process_cleanup: AsyncMock
+    mock_process_factory: Callable[..., MagicMock],
 ) -> None:
     """Test RTL-433 process management functionality.
     
@@ -122,708 +163,395 @@ async def test_coordinator_process_management(
     
     Args:
         coordinator: Test coordinator instance
-        mock_process_cleanup: Mock for process cleanup operations
-    """
-    mock_process = mock_process_cleanup.return_value
-    mock_process._is_mock = True
-    mock_process.returncode = None
-    mock_process.stdout.readline = AsyncMock(return_value=b'{"model":"Test","id":1234}\n')
-    mock_process.stderr.read = AsyncMock(return_value=b"")
-    mock_process.wait = AsyncMock(return_value=0)
-    mock_process.terminate = AsyncMock()
-
-    await coordinator._start_rtl433()
-    assert coordinator._process is not None
-    assert coordinator._read_task is not None
-    assert coordinator._monitor_task is not None
-
-    await coordinator.shutdown()
-    assert coordinator._shutdown is True
-    assert coordinator._process is None
-
-@pytest.mark.asyncio
-async def test_coordinator_process_timeout(
-    coordinator: RTL433Coordinator, 
-    hass: HomeAssistant
-) -> None:
-    """Test handling of RTL-433 process timeouts.
-    
-    Verifies that the coordinator properly handles:
-    1. Process output timeouts
-    2. Resource cleanup after timeout
-    3. Task cancellation
-    
-    Args:
-        coordinator: Test coordinator instance
-        hass: HomeAssistant instance for test environment
+        mock_process_factory: Builds mock rtl_433 processes
     """
-    mock_process = AsyncMock()
-    mock_process._is_mock = True
-    mock_process.returncode = None
-    mock_process.stdout = AsyncMock()
-    mock_process.stderr = AsyncMock()
-    mock_process.stdout.readline = AsyncMock(side_effect=asyncio.TimeoutError)
-    mock_process.stderr.read = AsyncMock(return_value=b"")
-    mock_process.wait = AsyncMock(return_value=0)
-    mock_process.terminate = AsyncMock()
+    mock_process = mock_process_factory()
+    coordinator._device_verified = True  # Skip the rtl_eeprom/rtl_test probe
 
     with patch('asyncio.create_subprocess_exec', return_value=mock_process):
-        await coordinator._start_rtl433()
-        assert coordinator._process is not None
-        assert coordinator._read_task is not None
+        await coordinator._start_rtl433_process()
+    assert coordinator._process is mock_process
+    assert len(coordinator._tasks) == 2  # Output reader and stderr monitor
 
-        # Wait for timeout handling
-        await wait_for_cleanup()
-        assert coordinator._process is None
+    await coordinator.async_shutdown()
+    assert coordinator._shutdown is True
+    assert coordinator._process is None
+    assert not coordinator._tasks
+    mock_process.terminate.assert_called_once()
 
 @pytest.mark.asyncio
-async def test_coordinator_stderr_timeout(
+@pytest.mark.parametrize(
+    "process_kwargs,shutdown",
+    [
+        ({}, True),
+        ({"stdout": [asyncio.TimeoutError()]}, False),
+        ({"stderr": [asyncio.TimeoutError()]}, False),
+        ({"stdout": [Exception("Test error")]}, False),
+    ],
+    ids=["shutdown", "readline-timeout", "stderr-timeout", "error"],
+)
+async def test_coordinator_process_lifecycle(
     coordinator: RTL433Coordinator, 
-    hass: HomeAssistant
+    mock_process_factory: Callable[..., MagicMock],
+    process_kwargs: Dict[str, Any],
+    shutdown: bool,
 ) -> None:
-    """Test handling of stderr read timeouts.
+    """Test RTL-433 process cleanup across the process lifecycle.
     
-    Verifies that the coordinator properly handles:
-    1. Stderr read timeouts
-    2. Continued process operation
-    3. Resource cleanup
+    Verifies that the coordinator releases the process and its tasks:
+    1. On an explicit shutdown of a healthy process
+    2. After stdout read timeouts
+    3. After stderr read timeouts
+    4. After process errors
     
     Args:
         coordinator: Test coordinator instance
-        hass: HomeAssistant instance for test environment
+        mock_process_factory: Builds mock rtl_433 processes
+        process_kwargs: Mock process behaviour for this case
+        shutdown: Whether the test shuts the coordinator down itself
     """
-    mock_process = AsyncMock()
-    mock_process._is_mock = True
-    mock_process.returncode = None
-    mock_process.stdout = AsyncMock()
-    mock_process.stderr = AsyncMock()
-    mock_process.stdout.readline = AsyncMock(return_value=b'{"model":"Test","id":1234}\n')
-    mock_process.stderr.read = AsyncMock(side_effect=asyncio.TimeoutError)
-    mock_process.wait = AsyncMock(return_value=0)
-    mock_process.terminate = AsyncMock()
+    mock_process = mock_process_factory(**process_kwargs)
+    coordinator._device_verified = True
 
     with patch('asyncio.create_subprocess_exec', return_value=mock_process):
-        await coordinator._start_rtl433()
-        assert coordinator._process is not None
-        assert coordinator._monitor_task is not None
+        await coordinator._start_rtl433_process()
 
-        # Wait for timeout handling
-        await wait_for_cleanup()
-        assert coordinator._process is None
+    if shutdown:
+        await coordinator.async_shutdown()
 
-@pytest.mark.asyncio
-async def test_coordinator_cleanup_on_start(
-    coordinator: RTL433Coordinator, 
-    hass: HomeAssistant
-) -> None:
-    """Test coordinator cleanup operations during startup.
-    
-    Verifies that the coordinator:
-    1. Cleans up existing resources before start
-    2. Initializes new process and tasks
-    3. Performs proper shutdown
-    
-    Args:
-        coordinator: Test coordinator instance
-        hass: HomeAssistant instance for test environment
-    """
-    mock_process = AsyncMock()
-    mock_process._is_mock = True
-    mock_process.returncode = None
-    mock_process.stdout = AsyncMock()
-    mock_process.stderr = AsyncMock()
-    mock_process.stdout.readline = AsyncMock(return_value=b'{"model":"Test","id":1234}\n')
-    mock_process.stderr.read = AsyncMock(return_value=b"")
-    mock_process.wait = AsyncMock(return_value=0)
-    mock_process.terminate = AsyncMock()
-
-    with patch('asyncio.create_subprocess_exec', return_value=mock_process):
-        await coordinator._start_rtl433()
-        assert coordinator._process is not None
-        assert coordinator._read_task is not None
-        assert coordinator._monitor_task is not None
-
-        await coordinator.shutdown()
-        await wait_for_cleanup()
-        assert coordinator._shutdown is True
-        assert coordinator._process is None
+    await wait_for_cleanup()
+    assert coordinator._shutdown is shutdown
+    assert coordinator._process is None
+    mock_process.terminate.assert_called_once()
+    # A failed stream ends its own task; the other keeps waiting on its pipe
+    assert len(coordinator._tasks) == (0 if shutdown else 1)
 
 @pytest.mark.asyncio
-async def test_coordinator_cleanup_on_error(
-    coordinator: RTL433Coordinator, 
-    hass: HomeAssistant
-) -> None:
-    """Test cleanup operations when errors occur.
+async def test_watchdog_backoff(coordinator: RTL433Coordinator) -> None:
+    """Test exponential backoff of the watchdog's restart attempts.
     
-    Verifies that the coordinator properly:
-    1. Handles process errors
-    2. Cleans up resources after errors
-    3. Maintains consistent state
+    Verifies that:
+    1. Restart delays start at the base retry delay
+    2. Restart delays double after each failure
+    3. The delay is capped at MAX_RETRY_DELAY
     
     Args:
         coordinator: Test coordinator instance
-        hass: HomeAssistant instance for test environment
     """
-    mock_process = AsyncMock()
-    mock_process._is_mock = True
-    mock_process.returncode = None
-    mock_process.stdout = AsyncMock()
-    mock_process.stderr = AsyncMock()
-    mock_process.stdout.readline = AsyncMock(side_effect=Exception("Test error"))
-    mock_process.stderr.read = AsyncMock(return_value=b"")
-    mock_process.wait = AsyncMock(return_value=0)
-    mock_process.terminate = AsyncMock()
+    clock = FakeClock()
+    attempts = 0
 
-    with patch('asyncio.create_subprocess_exec', return_value=mock_process):
-        try:
-            await coordinator._start_rtl433()
-        except ConfigEntryNotReady:
-            pass
+    async def fail_restart() -> Dict[str, Any]:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 8:
+            coordinator._shutdown = True
+        raise ConfigEntryNotReady("RTL-SDR device not found")
+
+    with patch.object(coordinator, "_fetch_rtl433_data", new=fail_restart), \
+         patch('asyncio.sleep', new=clock.sleep):
+        await coordinator._watch_process()
 
-        # Wait for cleanup completion
-        await wait_for_cleanup()
-        assert coordinator._process is None
-        assert coordinator._read_task is None
-        assert coordinator._monitor_task is None
+    assert clock.sleeps == [5, 10, 20, 40, 80, 160, MAX_RETRY_DELAY, MAX_RETRY_DELAY]
 
 @pytest.mark.asyncio
-async def test_coordinator_shutdown(
-    coordinator: RTL433Coordinator, 
-    hass: HomeAssistant
-) -> None:
-    """Test coordinator shutdown process.
-    
-    Verifies that the coordinator:
-    1. Properly shuts down the RTL-433 process
-    2. Cancels all monitoring tasks
-    3. Cleans up resources
-    4. Maintains consistent state
+async def test_watchdog_backoff_reset_after_success(coordinator: RTL433Coordinator) -> None:
+    """Test that a successful restart resets the watchdog's backoff.
     
     Args:
         coordinator: Test coordinator instance
-        hass: HomeAssistant instance for test environment
     """
-    mock_process = AsyncMock()
-    mock_process._is_mock = True
-    mock_process.returncode = None
-    mock_process.stdout = AsyncMock()
-    mock_process.stderr = AsyncMock()
-    mock_process.stdout.readline = AsyncMock(return_value=b'{"model":"Test","id":1234}\n')
-    mock_process.stderr.read = AsyncMock(return_value=b"")
-    mock_process.wait = AsyncMock(return_value=0)
-    mock_process.terminate = AsyncMock()
+    clock = FakeClock()
+    failure = ConfigEntryNotReady("RTL-SDR device not found")
+    outcomes: List[Any] = [failure, failure, None, failure]
 
-    with patch('asyncio.create_subprocess_exec', return_value=mock_process):
-        await coordinator._start_rtl433()
-        assert coordinator._process is not None
-        
-        await coordinator.shutdown()
-        await wait_for_cleanup()
-        
-        assert coordinator._shutdown is True
-        assert coordinator._process is None
-        assert coordinator._read_task is None
-        assert coordinator._monitor_task is None
+    async def restart() -> Dict[str, Any]:
+        outcome = outcomes.pop(0)
+        coordinator._shutdown = not outcomes
+        if outcome is not None:
+            raise outcome
+        return {}
 
-@pytest.mark.asyncio
-async def test_error_rate_limiting(coordinator: RTL433Coordinator) -> None:
-    """Test error rate limiting functionality.
-    
-    Verifies that:
-    1. Errors are logged initially
-    2. Frequent errors are rate limited
-    3. Rate limiting resets after timeout
-    4. Different error types are tracked separately
-    
-    Args:
-        coordinator: Test coordinator instance
-    """
-    # Test initial error logging
-    assert coordinator._should_log_error("test_error") is True
-    assert coordinator._should_log_error("test_error") is True
-    assert coordinator._should_log_error("test_error") is True
-    
-    # Test rate limiting after threshold
-    assert coordinator._should_log_error("test_error") is False
-    assert coordinator._should_log_error("test_error") is False
-    
-    # Test different error types are tracked separately
-    assert coordinator._should_log_error("different_error") is True
-    
-    # Test rate limit reset after timeout
-    coordinator._error_counts["test_error"] = (1, time.time() - 301)  # Past timeout
-    assert coordinator._should_log_error("test_error") is True
+    with patch.object(coordinator, "_fetch_rtl433_data", new=restart), \
+         patch('asyncio.sleep', new=clock.sleep):
+        await coordinator._watch_process()
+
+    assert clock.sleeps == [5, 10, 20, 5]
 
 @pytest.mark.asyncio
-async def test_exponential_backoff(
+async def test_watchdog_recovers_from_unexpected_error(
     coordinator: RTL433Coordinator,
-    hass: HomeAssistant
+    caplog: LogCaptureFixture,
 ) -> None:
-    """Test exponential backoff for retry attempts.
+    """Test that the watchdog survives unexpected restart errors.
     
     Verifies that:
-    1. Retry delays increase exponentially
-    2. Maximum retry delay is capped
-    3. Retry count is tracked correctly
+    1. A non-ConfigEntryNotReady error is logged and backed off
+    2. The device gets a fresh set of init attempts after a failure
+    3. The watchdog keeps retrying after the error
     
     Args:
         coordinator: Test coordinator instance
-        hass: HomeAssistant instance for test environment
+        caplog: Fixture for capturing log messages
     """
-    mock_process = AsyncMock()
-    mock_process._is_mock = True
-    mock_process.returncode = 1  # Simulate failure
-    
-    sleep_times = []
-    
-    async def mock_sleep(delay):
-        sleep_times.append(delay)
-    
-    with patch('asyncio.create_subprocess_exec', side_effect=Exception("Test error")), \
-         patch('asyncio.sleep', new=mock_sleep):
-        
-        # Test multiple retry attempts
-        for _ in range(3):
-            try:
-                await coordinator._async_update_data()
-            except UpdateFailed:
-                pass
-    
-    # Verify exponential backoff
-    assert len(sleep_times) == 3
-    assert sleep_times[0] == 5  # First retry: 5 seconds
-    assert sleep_times[1] == 10  # Second retry: 10 seconds
-    assert sleep_times[2] == 20  # Third retry: 20 seconds
+    clock = FakeClock()
+    init_attempts: List[int] = []
+
+    async def restart() -> Dict[str, Any]:
+        init_attempts.append(coordinator._device_init_attempts)
+        if len(init_attempts) == 2:
+            coordinator._shutdown = True
+            return {}
+        coordinator._device_init_attempts = coordinator._max_device_init_attempts
+        raise RuntimeError("usb transfer failed")
+
+    with patch.object(coordinator, "_fetch_rtl433_data", new=restart), \
+         patch('asyncio.sleep', new=clock.sleep):
+        await coordinator._watch_process()
+
+    assert init_attempts == [0, 0]
+    assert clock.sleeps == [5, 10]
+    assert any(
+        "Unexpected error restarting RTL-433 process" in record.message
+        for record in caplog.records
+        if record.levelname == "ERROR"
+    )
 
 @pytest.mark.asyncio
 async def test_error_context_preservation(
     coordinator: RTL433Coordinator,
-    hass: HomeAssistant,
+    mock_process_factory: Callable[..., MagicMock],
     caplog: LogCaptureFixture,
 ) -> None:
     """Test preservation of error context during failures.
     
     Verifies that:
-    1. Error messages include relevant context
-    2. Error types are properly categorized
-    3. Error handling chain is maintained
+    1. Invalid JSON output is skipped without an error
+    2. Critical stderr messages are logged with the rtl_433 output
+    3. The process is released after a critical error
     
     Args:
         coordinator: Test coordinator instance
-        hass: HomeAssistant instance for test environment
+        mock_process_factory: Builds mock rtl_433 processes
         caplog: Pytest fixture for capturing log messages
     """
-    mock_process = AsyncMock()
-    mock_process._is_mock = True
-    mock_process.returncode = None
-    mock_process.stdout = AsyncMock()
-    mock_process.stderr = AsyncMock()
-    
-    # Test JSON decode error
-    mock_process.stdout.readline = AsyncMock(return_value=b'invalid json')
-    
-    with patch('asyncio.create_subprocess_exec', return_value=mock_process):
-        await coordinator._start_rtl433()
-        # Allow error to be processed
-        await asyncio.sleep(0.1)
-        
-        # Verify error was logged with context
-        assert any(
-            "Failed to parse RTL-433 JSON data" in record.message
-            for record in caplog.records
-            if record.levelname == "WARNING"
-        )
-    
-    # Clear captured logs
-    caplog.clear()
-    
-    # Test process error with stderr message
-    error_message = "USB error occurred"
-    mock_process.stderr.read = AsyncMock(return_value=error_message.encode())
-    
+    error_message = "usb_claim_interface error -6"
+    mock_process = mock_process_factory(
+        stdout=[b"invalid json\n"],
+        stderr=[error_message.encode() + b"\n"],
+    )
+    coordinator._device_verified = True
+
     with patch('asyncio.create_subprocess_exec', return_value=mock_process):
-        try:
-            await coordinator._start_rtl433()
-            await asyncio.sleep(0.1)  # Allow error to be processed
-        except ConfigEntryNotReady as err:
-            assert error_message in str(err)
-            assert any(
-                error_message in record.message
-                for record in caplog.records
-                if record.levelname == "ERROR"
-            )
+        await coordinator._start_rtl433_process()
+    await wait_for_cleanup()
+
+    errors = [record.message for record in caplog.records if record.levelname == "ERROR"]
+    assert errors == [f"Critical RTL-433 error: {error_message}"]
+    assert coordinator._process is None
 
 @pytest.mark.asyncio
-async def test_device_reconnection_backoff(
-    coordinator: RTL433Coordinator,
-    hass: HomeAssistant,
-    caplog: LogCaptureFixture,
-) -> None:
-    """Test device reconnection backoff strategy.
+async def test_protocol_validation(coordinator: RTL433Coordinator) -> None:
+    """Test protocol filtering of received records.
     
     Verifies that:
-    1. Initial connection attempts use minimal delay
-    2. Subsequent failures increase backoff time
-    3. Successful connection resets backoff
-    4. Maximum backoff time is enforced
+    1. Records from protocols in the filter are accepted
+    2. Records from other protocols are dropped
+    3. Records without a protocol number are accepted
     
     Args:
         coordinator: Test coordinator instance
-        hass: HomeAssistant instance
-        caplog: Fixture for capturing log messages
     """
-    # Mock time functions to control timing
-    current_time = 0.0
-    
-    def mock_time():
-        return current_time
-    
-    sleep_times = []
-    
-    async def mock_sleep(delay):
-        sleep_times.append(delay)
-        nonlocal current_time
-        current_time += delay
-    
-    with patch('time.time', new=mock_time), \
-         patch('asyncio.sleep', new=mock_sleep):
-        
-        # Test initial connection attempt
-        mock_process = AsyncMock()
-        mock_process._is_mock = True
-        mock_process.returncode = 1
-        
-        with patch('asyncio.create_subprocess_exec', 
-                  side_effect=Exception("Connection failed")):
-            try:
-                await coordinator._handle_device_connection()
-            except ConfigEntryNotReady:
-                pass
-        
-        # Verify initial backoff
-        assert len(sleep_times) == 1
-        assert sleep_times[0] == coordinator._current_backoff_time
-        
-        # Test increasing backoff
-        sleep_times.clear()
-        for _ in range(3):
-            try:
-                await coordinator._handle_device_connection()
-            except ConfigEntryNotReady:
-                pass
-        
-        # Verify backoff increases
-        assert len(sleep_times) == 3
-        assert sleep_times[1] > sleep_times[0]
-        assert sleep_times[2] > sleep_times[1]
-        
-        # Test maximum backoff limit
-        sleep_times.clear()
-        coordinator._connection_attempts = 10  # Force high backoff
-        
-        try:
-            await coordinator._handle_device_connection()
-        except ConfigEntryNotReady:
-            pass
-        
-        assert sleep_times[0] <= coordinator.MAX_BACKOFF_TIME
+    coordinator.protocol_filter = frozenset({40})
+    coordinator._process_batch((
+        {"model": "Acurite-5n1", "id": 1234, "protocol": 40, "temperature_C": 22.5},
+        {"model": "Acurite-5n1", "id": 9012, "protocol": 55, "temperature_C": 23.9},
+        {"model": "LaCrosse-TX141W", "id": 5678, "temperature_C": 20.1},
+    ))
+
+    assert set(coordinator.data) == {"Acurite-5n1_1234", "LaCrosse-TX141W_5678"}
 
 @pytest.mark.asyncio
-async def test_backoff_reset_after_success(
-    coordinator: RTL433Coordinator,
-    hass: HomeAssistant,
-) -> None:
-    """Test backoff reset after successful connection.
+async def test_protocol_configuration_validation(hass: HomeAssistant) -> None:
+    """Test protocol configuration validation.
     
     Verifies that:
-    1. Backoff state is reset after successful connection
-    2. Connection metrics are updated properly
-    3. Subsequent failures start with initial backoff
+    1. Protocol numbers from the config are parsed into the filter
+    2. Each configured protocol is passed to rtl_433
+    3. Non-numeric protocols in config are rejected
     
     Args:
-        coordinator: Test coordinator instance
         hass: HomeAssistant instance
     """
-    current_time = 0.0
-    
-    def mock_time():
-        return current_time
+    coordinator = RTL433Coordinator(hass, device_id="0", protocol_filter=["40", "55"])
+    assert coordinator.protocol_filter == frozenset({40, 55})
+    assert coordinator._rtl_cmd[-4:] == ["-R", "40", "-R", "55"]
+
+    with pytest.raises(ValueError):
+        RTL433Coordinator(hass, device_id="0", protocol_filter=["Acurite-5n1"])
+
+@pytest.mark.asyncio
+async def test_updates_coalesced_per_flush(coordinator: RTL433Coordinator) -> None:
+    """Test that a burst of records produces a single coordinator update.
     
-    with patch('time.time', new=mock_time):
-        # Simulate some failed attempts
-        coordinator._connection_attempts = 5
-        coordinator._current_backoff_time = 100
-        
-        # Simulate successful connection
-        mock_process = AsyncMock()
-        mock_process._is_mock = True
-        mock_process.returncode = None
-        mock_process.stdout = AsyncMock()
-        mock_process.stderr = AsyncMock()
-        mock_process.stdout.readline = AsyncMock(return_value=b'{"model":"Test","id":1234}\n')
-        mock_process.stderr.read = AsyncMock(return_value=b"")
-        
-        with patch('asyncio.create_subprocess_exec', return_value=mock_process):
-            await coordinator._handle_device_connection()
-        
-        # Verify connection state reset
-        assert coordinator._connection_attempts == 0
-        assert coordinator._current_backoff_time == coordinator.INITIAL_BACKOFF_TIME
-        assert coordinator._last_successful_connection == current_time
+    Args:
+        coordinator: Test coordinator instance
+    """
+    with patch.object(coordinator, "async_set_updated_data") as set_updated_data:
+        for device_id in (1234, 1235, 1236):
+            await coordinator._process_device_data(
+                {"model": "Acurite-5n1", "id": device_id, "temperature_C": 22.5}
+            )
+        set_updated_data.assert_not_called()
+
+        await asyncio.sleep(UPDATE_FLUSH_DELAY + 0.05)
+
+    set_updated_data.assert_called_once_with(coordinator.data)
+    assert coordinator._flush_handle is None
 
 @pytest.mark.asyncio
-async def test_connection_error_handling(
+async def test_new_devices_announced_once_per_flush(
     coordinator: RTL433Coordinator,
     hass: HomeAssistant,
-    caplog: LogCaptureFixture,
 ) -> None:
-    """Test connection error handling and logging.
-    
-    Verifies that:
-    1. Different error types are handled appropriately
-    2. Error messages are properly logged
-    3. Connection state is updated on errors
-    4. Cleanup is performed after errors
+    """Test that new devices are announced together, and only once.
     
     Args:
         coordinator: Test coordinator instance
         hass: HomeAssistant instance
-        caplog: Fixture for capturing log messages
     """
-    # Test USB error handling
-    mock_process = AsyncMock()
-    mock_process._is_mock = True
-    mock_process.returncode = None
-    mock_process.stdout = AsyncMock()
-    mock_process.stderr = AsyncMock()
-    mock_process.stderr.read = AsyncMock(return_value=b"usb_claim_interface error")
-    
-    with patch('asyncio.create_subprocess_exec', return_value=mock_process):
-        try:
-            await coordinator._handle_device_connection()
-        except ConfigEntryNotReady as err:
-            assert "device is in use" in str(err).lower()
-    
-    # Verify error logging
-    assert any(
-        "Failed to connect to RTL-433 device" in record.message
-        for record in caplog.records
-        if record.levelname == "ERROR"
+    announced: List[List[str]] = []
+
+    @callback
+    def _async_new_devices(device_ids: List[str]) -> None:
+        announced.append(list(device_ids))
+
+    unsub = async_dispatcher_connect(hass, coordinator.new_device_signal, _async_new_devices)
+    records = (
+        {"model": "Acurite-5n1", "id": 1234, "temperature_C": 22.5},
+        {"model": "LaCrosse-TX141W", "id": 5678, "temperature_C": 20.1},
     )
-    
-    # Test device not found error
-    caplog.clear()
-    mock_process.stderr.read = AsyncMock(return_value=b"not found")
-    
-    with patch('asyncio.create_subprocess_exec', return_value=mock_process):
-        try:
-            await coordinator._handle_device_connection()
-        except ConfigEntryNotReady as err:
-            assert "not found" in str(err).lower()
-    
-    # Verify connection state
-    assert coordinator._last_successful_connection == 0
-    assert coordinator._process is None
+    for _ in range(2):
+        coordinator._process_batch(records)
+        await asyncio.sleep(UPDATE_FLUSH_DELAY + 0.05)
+    unsub()
+
+    assert announced == [["Acurite-5n1_1234", "LaCrosse-TX141W_5678"]]
 
 @pytest.mark.asyncio
-async def test_protocol_validation(
+async def test_overlong_output_line_skipped(
     coordinator: RTL433Coordinator,
+    mock_process_factory: Callable[..., MagicMock],
     caplog: LogCaptureFixture,
 ) -> None:
-    """Test protocol validation functionality.
-    
-    Verifies that:
-    1. Valid protocols are accepted
-    2. Invalid protocols are rejected
-    3. Protocol filtering works correctly
-    4. Error messages are properly logged
+    """Test that an overlong rtl_433 line is skipped without stopping the reader.
     
     Args:
         coordinator: Test coordinator instance
+        mock_process_factory: Builds mock rtl_433 processes
         caplog: Fixture for capturing log messages
     """
-    # Test valid protocol
-    valid_data = {
-        "model": "Acurite-5n1",
-        "id": 1234,
-        "temperature_F": 72.5,
-        "humidity": 45,
-    }
-    coordinator._process_data(valid_data)
-    assert f"Acurite-5n1_1234" in coordinator.data
-    
-    # Test invalid protocol
-    invalid_data = {
-        "model": "Invalid-Model",
-        "id": 5678,
-        "temperature_C": 22.5,
-    }
-    coordinator._process_data(invalid_data)
-    assert "Invalid-Model_5678" not in coordinator.data
+    coordinator._process = mock_process_factory(stdout=[
+        ValueError("Separator is found, but chunk is longer than limit"),
+        b'{"model":"Acurite-5n1","id":1234,"temperature_C":22.5}\n',
+        b"",
+    ])
+
+    await coordinator._read_rtl433_output()
+
+    assert "Acurite-5n1_1234" in coordinator.data
     assert any(
-        "Unsupported protocol: Invalid-Model" in record.message
+        "Skipped RTL-433 output line longer than" in record.message
         for record in caplog.records
         if record.levelname == "WARNING"
     )
-    
-    # Test protocol filter
-    coordinator._protocol_filter = {"Acurite-Tower"}
-    filtered_data = {
-        "model": "Acurite-5n1",  # Valid but filtered
-        "id": 9012,
-        "temperature_F": 75.0,
-    }
-    coordinator._process_data(filtered_data)
-    assert "Acurite-5n1_9012" not in coordinator.data
 
 @pytest.mark.asyncio
-async def test_value_validation(
-    coordinator: RTL433Coordinator,
-    caplog: LogCaptureFixture,
-) -> None:
-    """Test sensor value validation.
-    
-    Verifies that:
-    1. Values within range are accepted
-    2. Values outside range are rejected
-    3. Step size validation works
-    4. Error messages are properly logged
+async def test_unsupported_model_dropped(coordinator: RTL433Coordinator) -> None:
+    """Test that frames from unsupported models are dropped before any work.
     
     Args:
         coordinator: Test coordinator instance
-        caplog: Fixture for capturing log messages
     """
-    # Test valid values
-    valid_data = {
-        "model": "Acurite-5n1",
-        "id": 1234,
-        "temperature_F": 72.5,
-        "humidity": 45,
-        "wind_avg_km_h": 15.5,
-        "wind_dir_deg": 180,
-        "rain_in": 0.25,
-    }
-    coordinator._process_data(valid_data)
-    assert coordinator.data["Acurite-5n1_1234"]["temperature_F"] == 72.5
-    
-    # Test out of range values
-    invalid_data = {
-        "model": "Acurite-5n1",
-        "id": 5678,
-        "temperature_F": 200.0,  # Too high
-        "humidity": 150,         # Too high
-        "wind_dir_deg": 400,     # Too high
-    }
-    coordinator._process_data(invalid_data)
-    device_id = "Acurite-5n1_5678"
-    if device_id in coordinator.data:
-        assert "temperature_F" not in coordinator.data[device_id]
-        assert "humidity" not in coordinator.data[device_id]
-        assert "wind_dir_deg" not in coordinator.data[device_id]
-    
-    # Verify error logging
-    assert any(
-        "Invalid temperature_F value" in record.message
-        for record in caplog.records
-        if record.levelname == "WARNING"
-    )
-    
-    # Test step size validation
-    step_data = {
-        "model": "Acurite-5n1",
-        "id": 9012,
-        "temperature_F": 72.123,  # Invalid step (should be 0.1)
-        "humidity": 45.5,         # Invalid step (should be 1)
-    }
-    coordinator._process_data(step_data)
-    device_id = "Acurite-5n1_9012"
-    if device_id in coordinator.data:
-        assert "temperature_F" not in coordinator.data[device_id]
-        assert "humidity" not in coordinator.data[device_id]
+    coordinator._process_batch((
+        {"model": "Other-Model", "id": 9012, "temperature_C": 21.0, "rssi": -0.1},
+    ))
+
+    assert not coordinator.data
+    assert not coordinator._new_device_ids
+    assert coordinator._flush_handle is None
 
 @pytest.mark.asyncio
-async def test_protocol_configuration_validation(
-    hass: HomeAssistant,
-    caplog: LogCaptureFixture,
-) -> None:
-    """Test protocol configuration validation.
-    
-    Verifies that:
-    1. Valid protocol configurations are accepted
-    2. Invalid protocols in config are rejected
-    3. Error messages are properly formatted
+async def test_signal_quality_without_levels(coordinator: RTL433Coordinator) -> None:
+    """Test that frames without level data skip signal quality evaluation.
     
     Args:
-        hass: HomeAssistant instance
-        caplog: Fixture for capturing log messages
+        coordinator: Test coordinator instance
     """
-    # Test valid configuration
-    valid_config = {
-        "device": "0",
-        "protocol_filter": ["Acurite-5n1", "LaCrosse-TX141W"],
-    }
-    coordinator = RTL433Coordinator(hass, "test_entry", valid_config)
-    assert len(coordinator._protocol_filter) == 2
-    
-    # Test invalid configuration
-    invalid_config = {
-        "device": "0",
-        "protocol_filter": ["Invalid-Model", "Another-Invalid"],
-    }
-    with pytest.raises(ValueError) as excinfo:
-        RTL433Coordinator(hass, "test_entry", invalid_config)
-    
-    assert "Invalid protocol specified" in str(excinfo.value)
-    assert "Invalid-Model" in str(excinfo.value)
-    assert "Another-Invalid" in str(excinfo.value)
+    coordinator._process_batch((
+        {"model": "Acurite-5n1", "id": 1234, "temperature_C": 22.5},
+        {"model": "LaCrosse-TX141W", "id": 5678, "temperature_C": 20.1,
+         "rssi": -0.1, "snr": 25.0, "noise": -30.0},
+    ))
+
+    assert coordinator.data["Acurite-5n1_1234"]["signal_quality"]["quality"] == "unknown"
+    assert "Acurite-5n1_1234" not in coordinator._signal_quality_history
+    assert coordinator.data["LaCrosse-TX141W_5678"]["signal_quality"]["quality"] != "unknown"
+    assert "LaCrosse-TX141W_5678" in coordinator._signal_quality_history
 
 @pytest.mark.asyncio
-async def test_mixed_value_validation(
-    coordinator: RTL433Coordinator,
-    caplog: LogCaptureFixture,
-) -> None:
-    """Test validation of mixed valid and invalid values.
-    
-    Verifies that:
-    1. Valid values are preserved when some are invalid
-    2. Non-numeric values are handled correctly
-    3. Special fields are preserved
-    4. Partial updates work correctly
+async def test_legacy_sensor_unique_id(coordinator: RTL433Coordinator) -> None:
+    """Test the coordinator module's RTL433Sensor exposes its unique_id and state.
     
     Args:
         coordinator: Test coordinator instance
-        caplog: Fixture for capturing log messages
     """
-    mixed_data = {
-        "model": "Acurite-5n1",
-        "id": 1234,
-        "temperature_F": 72.5,    # Valid
-        "humidity": 150,          # Invalid
-        "battery_ok": True,       # Non-numeric
-        "message_type": 5,        # Special field
-        "wind_dir_deg": "North",  # Invalid type
-    }
-    
-    coordinator._process_data(mixed_data)
-    device_data = coordinator.data.get("Acurite-5n1_1234", {})
-    
-    # Check valid values are preserved
-    assert device_data.get("temperature_F") == 72.5
-    assert device_data.get("battery_ok") is True
-    assert device_data.get("message_type") == 5
+    coordinator._process_batch(({"model": "Acurite-5n1", "id": 1234, "temperature_C": 22.5},))
+    device_info = coordinator.data["Acurite-5n1_1234"]["device_info"]
+    sensor = coordinator_module.RTL433Sensor(
+        coordinator, "Acurite-5n1_1234", "Acurite-5n1 Sensor 1234", device_info
+    )
+
+    assert sensor.unique_id == "Acurite-5n1_1234"
+    assert sensor.state is coordinator.data["Acurite-5n1_1234"]["sensor_data"]
+    assert sensor.state["temperature_C"] == 22.5
+
+def _add_usb_device(
+    sysfs: Path, name: str, vendor: str, product: str, busnum: int, devnum: int,
+    serial: str = "00000001",
+) -> None:
+    """Create a fake sysfs USB device directory."""
+    device = sysfs / name
+    device.mkdir()
+    for attr, value in (
+        ("idVendor", vendor),
+        ("idProduct", product),
+        ("busnum", str(busnum)),
+        ("devnum", str(devnum)),
+        ("serial", serial),
+    ):
+        (device / attr).write_text(f"{value}\n")
+
+def test_find_rtlsdr_usb_path(tmp_path: Path) -> None:
+    """Test the usbfs reset path is only resolved when it is unambiguous.
     
-    # Check invalid values are excluded
-    assert "humidity" not in device_data
-    assert "wind_dir_deg" not in device_data
+    Verifies that:
+    1. A single attached dongle is found for index 0
+    2. Other indexes never use the direct reset
+    3. Several dongles are only told apart by serial
     
-    # Verify error logging
-    assert any(
-        "Invalid humidity value" in record.message
-        for record in caplog.records
-        if record.levelname == "WARNING"
-    )
-    assert any(
-        "Failed to convert wind_dir_deg value" in record.message
-        for record in caplog.records
-        if record.levelname == "WARNING"
-    )
\ No newline at end of file
+    Args:
+        tmp_path: Directory standing in for /sys/bus/usb/devices
+    """
+    _add_usb_device(tmp_path, "1-1", "0bda", "2838", 1, 5, serial="AAA")
+    _add_usb_device(tmp_path, "1-2", "046d", "c52b", 1, 2)  # Not an RTL-SDR
+
+    with patch.object(coordinator_module, "SYSFS_USB_DEVICES", str(tmp_path)):
+        find = coordinator_module._find_rtlsdr_usb_path
+        assert find("0") == "/dev/bus/usb/001/005"
+        assert find("1") is None
+
+        _add_usb_device(tmp_path, "2-1", "0bda", "2832", 2, 3, serial="BBB")
+        assert find("0") is None
+        assert find(":BBB") == "/dev/bus/usb/002/003"
+        assert find(":CCC") is None
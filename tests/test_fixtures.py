@@ -2,7 +2,9 @@
 import asyncio
 import json
 import logging
+import os
 from typing import AsyncGenerator, Dict, Optional, Tuple
+from types import MappingProxyType
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -11,9 +13,27 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 _LOGGER = logging.getLogger(__name__)
 
+# rtl_433 output line sent in normal operation, encoded once
+_NORMAL_STDOUT_BYTES = json.dumps({
+    "model": "Acurite-Tower",
+    "id": 1234,
+    "temperature_C": 22.5,
+    "humidity": 45,
+    "battery_ok": 1,
+    "channel": "A"
+}).encode() + b"\n"
+
 class RTL433ProcessMock:
     """Mock RTL-433 process with debugging capabilities."""
 
+    _ERROR_SCENARIOS = MappingProxyType({
+        "device_busy": (b"", b"usb_claim_interface error", 1),
+        "device_not_found": (b"", b"not found", 1),
+        "invalid_json": (b"invalid json data\n", b"", 0),
+        "timeout": (b"", b"", -1),
+    })
+    _UNKNOWN_ERROR = (b"", b"unknown error", 1)
+
     def __init__(self):
         """Initialize RTL-433 process mock."""
         self.stdout = AsyncMock()
@@ -38,28 +58,14 @@ class RTL433ProcessMock:
     def configure_normal_operation(self) -> None:
         """Configure mock for normal operation."""
         self.returncode = 0
-        self._stdout_data = json.dumps({
-            "model": "Acurite-Tower",
-            "id": 1234,
-            "temperature_C": 22.5,
-            "humidity": 45,
-            "battery_ok": 1,
-            "channel": "A"
-        }).encode() + b"\n"
+        self._stdout_data = _NORMAL_STDOUT_BYTES
         self._stderr_data = b""
         self.debug_info["command_history"].append("configure_normal_operation")
         self._configure_communicate()
 
     def configure_error_scenario(self, scenario: str) -> None:
         """Configure mock for various error scenarios."""
-        scenarios = {
-            "device_busy": (b"", b"usb_claim_interface error", 1),
-            "device_not_found": (b"", b"not found", 1),
-            "invalid_json": (b"invalid json data\n", b"", 0),
-            "timeout": (b"", b"", -1),
-        }
-        
-        stdout, stderr, return_code = scenarios.get(scenario, (b"", b"unknown error", 1))
+        stdout, stderr, return_code = self._ERROR_SCENARIOS.get(scenario, self._UNKNOWN_ERROR)
         self._stdout_data = stdout
         self._stderr_data = stderr
         self.returncode = return_code
@@ -82,28 +88,26 @@ class RTL433ProcessMock:
 
     def get_debug_report(self) -> str:
         """Generate a debug report of mock's operation."""
-        report = [
-            "RTL-433 Process Mock Report:",
-            f"Return Code: {self.returncode}",
-            f"Commands Received: {len(self.debug_info['command_history'])}",
-            f"Data Packets Sent: {len(self.debug_info['data_sent'])}",
-            f"Errors Generated: {len(self.debug_info['errors_generated'])}"
-        ]
-
-        if self.debug_info["command_history"]:
-            report.append("\nCommand History:")
-            for cmd in self.debug_info["command_history"]:
-                report.append(f"- {cmd}")
-
-        if self.debug_info["errors_generated"]:
-            report.append("\nErrors Generated:")
-            for error in self.debug_info["errors_generated"]:
-                report.append(f"- Scenario: {error['scenario']}")
-                report.append(f"  Stdout: {error['stdout']}")
-                report.append(f"  Stderr: {error['stderr']}")
-                report.append(f"  Return Code: {error['return_code']}")
-
-        return "\n".join(report)
+        history = self.debug_info["command_history"]
+        errors = self.debug_info["errors_generated"]
+        report = (
+            "RTL-433 Process Mock Report:\n"
+            f"Return Code: {self.returncode}\n"
+            f"Commands Received: {len(history)}\n"
+            f"Data Packets Sent: {len(self.debug_info['data_sent'])}\n"
+            f"Errors Generated: {len(errors)}"
+        )
+        if history:
+            report += "\n\nCommand History:\n" + "\n".join(f"- {cmd}" for cmd in history)
+        if errors:
+            report += "\n\nErrors Generated:\n" + "\n".join(
+                f"- Scenario: {error['scenario']}\n"
+                f"  Stdout: {error['stdout']}\n"
+                f"  Stderr: {error['stderr']}\n"
+                f"  Return Code: {error['return_code']}"
+                for error in errors
+            )
+        return report
 
 @pytest.fixture
 def mock_rtl433_data() -> Dict:
@@ -170,7 +174,9 @@ async def mock_rtl433_process() -> AsyncGenerator:
 
 @pytest.fixture
 def enable_debug_logging(caplog) -> None:
-    """Enable debug logging for tests."""
+    """Enable debug logging for tests when RTL433_TEST_DEBUG is set."""
+    if not os.environ.get("RTL433_TEST_DEBUG"):
+        return
     caplog.set_level(logging.DEBUG)
     _LOGGER.setLevel(logging.DEBUG)
 
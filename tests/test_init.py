@@ -11,20 +11,50 @@ from custom_components.rtl433 import (
 )
 from custom_components.rtl433.const import DOMAIN
 
-@pytest.fixture
-def mock_setup_entry():
-    """Mock setup entry."""
+def _make_entry(index: int = 0) -> ConfigEntry:
+    """Create a config entry for the given device index."""
+    return ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=DOMAIN,
+        title=f"RTL-433 Test {index}",
+        data={
+            "device": str(index),
+            "frequency": "433.92M",
+            "gain": 40,
+        },
+        source="test",
+        options={},
+        unique_id=f"test_unique_id_{index}",
+        entry_id=f"test_entry_{index}",
+    )
+
+@pytest.fixture(scope="module")
+def _forward_entry_setup_patch():
+    """Patch platform forwarding once for the whole module."""
     with patch('homeassistant.config_entries.ConfigEntries.async_forward_entry_setup',
               return_value=True) as forward_mock:
         yield forward_mock
 
-@pytest.fixture
-def mock_unload_entry():
-    """Mock unload entry."""
+@pytest.fixture(scope="module")
+def _unload_platforms_patch():
+    """Patch platform unloading once for the whole module."""
     with patch('homeassistant.config_entries.ConfigEntries.async_unload_platforms',
               return_value=True) as unload_mock:
         yield unload_mock
 
+@pytest.fixture
+def mock_setup_entry(_forward_entry_setup_patch):
+    """Mock setup entry."""
+    _forward_entry_setup_patch.reset_mock()
+    return _forward_entry_setup_patch
+
+@pytest.fixture
+def mock_unload_entry(_unload_platforms_patch):
+    """Mock unload entry."""
+    _unload_platforms_patch.reset_mock()
+    return _unload_platforms_patch
+
 @pytest.mark.asyncio
 async def test_setup_with_config(hass: HomeAssistant):
     """Test setup with config."""
@@ -33,55 +63,31 @@ async def test_setup_with_config(hass: HomeAssistant):
     assert DOMAIN in hass.data
 
 @pytest.mark.asyncio
-async def test_setup_entry(hass: HomeAssistant, mock_setup_entry):
-    """Test setup entry."""
-    entry = ConfigEntry(
-        version=1,
-        minor_version=1,
-        domain=DOMAIN,
-        title="RTL-433 Test",
-        data={
-            "device": "0",
-            "frequency": "433.92M",
-            "gain": 40,
-        },
-        source="test",
-        options={},
-        unique_id="test_unique_id",
-        entry_id="test_entry",
-    )
+@pytest.mark.parametrize("n_entries", [1, 2])
+async def test_setup_entry(hass: HomeAssistant, mock_setup_entry, n_entries: int):
+    """Test setting up one or more entries."""
+    entries = [_make_entry(i) for i in range(n_entries)]
 
     with patch('custom_components.rtl433.coordinator.RTL433Coordinator') as mock_coordinator:
         mock_coordinator_instance = mock_coordinator.return_value
         mock_coordinator_instance.async_config_entry_first_refresh = AsyncMock()
         
-        assert await async_setup_entry(hass, entry)
-        assert DOMAIN in hass.data
-        assert entry.entry_id in hass.data[DOMAIN]
-        assert isinstance(hass.data[DOMAIN][entry.entry_id], dict)
-        assert "coordinator" in hass.data[DOMAIN][entry.entry_id]
-        
-        # Verify platform setup
-        mock_setup_entry.assert_called_once_with(entry, Platform.SENSOR)
+        for entry in entries:
+            assert await async_setup_entry(hass, entry)
+            assert DOMAIN in hass.data
+            assert entry.entry_id in hass.data[DOMAIN]
+            assert isinstance(hass.data[DOMAIN][entry.entry_id], dict)
+            assert "coordinator" in hass.data[DOMAIN][entry.entry_id]
+            
+            # Verify platform setup for each entry
+            mock_setup_entry.assert_any_call(entry, Platform.SENSOR)
+
+        assert mock_setup_entry.call_count == n_entries
 
 @pytest.mark.asyncio
 async def test_unload_entry(hass: HomeAssistant, mock_unload_entry):
     """Test unloading an entry."""
-    entry = ConfigEntry(
-        version=1,
-        minor_version=1,
-        domain=DOMAIN,
-        title="RTL-433 Test",
-        data={
-            "device": "0",
-            "frequency": "433.92M",
-            "gain": 40,
-        },
-        source="test",
-        options={},
-        unique_id="test_unique_id",
-        entry_id="test_entry",
-    )
+    entry = _make_entry()
 
     with patch('custom_components.rtl433.coordinator.RTL433Coordinator') as mock_coordinator:
         mock_coordinator_instance = mock_coordinator.return_value
@@ -94,38 +100,3 @@ async def test_unload_entry(hass: HomeAssistant, mock_unload_entry):
         
         # Verify platform unload
         mock_unload_entry.assert_called_once_with(entry, [Platform.SENSOR])
-
-@pytest.mark.asyncio
-async def test_setup_multiple_entries(hass: HomeAssistant, mock_setup_entry):
-    """Test setting up multiple entries."""
-    entries = [
-        ConfigEntry(
-            version=1,
-            minor_version=1,
-            domain=DOMAIN,
-            title=f"RTL-433 Test {i}",
-            data={
-                "device": str(i),
-                "frequency": "433.92M",
-                "gain": 40,
-            },
-            source="test",
-            options={},
-            unique_id=f"test_unique_id_{i}",
-            entry_id=f"test_entry_{i}",
-        )
-        for i in range(2)
-    ]
-
-    with patch('custom_components.rtl433.coordinator.RTL433Coordinator') as mock_coordinator:
-        mock_coordinator_instance = mock_coordinator.return_value
-        mock_coordinator_instance.async_config_entry_first_refresh = AsyncMock()
-        
-        for entry in entries:
-            assert await async_setup_entry(hass, entry)
-            assert entry.entry_id in hass.data[DOMAIN]
-            assert isinstance(hass.data[DOMAIN][entry.entry_id], dict)
-            assert "coordinator" in hass.data[DOMAIN][entry.entry_id]
-            
-            # Verify platform setup for each entry
-            mock_setup_entry.assert_any_call(entry, Platform.SENSOR)
\ No newline at end of file
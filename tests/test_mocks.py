@@ -3,21 +3,59 @@ import asyncio
 import json
 import logging
 from typing import Any, Dict, List, Optional
+from types import MappingProxyType
 from unittest.mock import AsyncMock, MagicMock
 
 _LOGGER = logging.getLogger(__name__)
 
+# Sample rtl_433 records and their encoded output lines, built once
+_SAMPLE_DATA: List[Dict[str, Any]] = [
+    {
+        "model": "Acurite-Tower",
+        "id": 1234,
+        "temperature_C": 22.5,
+        "humidity": 45,
+        "battery_ok": 1,
+        "channel": "A",
+        "_debug": {
+            "timestamp": "2024-01-01 00:00:00",
+            "signal_strength": -75
+        }
+    },
+    {
+        "model": "Oregon-THN128",
+        "id": 5678,
+        "temperature_C": 23.0,
+        "battery": 1,
+        "_debug": {
+            "timestamp": "2024-01-01 00:00:01",
+            "signal_strength": -80
+        }
+    }
+]
+
+_SAMPLE_DATA_BYTES: List[bytes] = [
+    json.dumps(data).encode() + b"\n" for data in _SAMPLE_DATA
+]
+
 class DebugAsyncMock(AsyncMock):
     """AsyncMock with debugging capabilities."""
 
-    def __init__(self, *args, **kwargs):
-        """Initialize debug async mock."""
+    def __init__(self, *args, track: bool = False, **kwargs):
+        """Initialize debug async mock.
+
+        Call and error history are only recorded when track is set.
+        """
         super().__init__(*args, **kwargs)
+        self.track = track
         self.call_history: List[Dict[str, Any]] = []
         self.error_history: List[Dict[str, Any]] = []
 
     async def __call__(self, *args, **kwargs):
         """Track mock calls with debug info."""
+        if not self.track:
+            return await super().__call__(*args, **kwargs)
+
         call_info = {
             "args": args,
             "kwargs": kwargs,
@@ -40,6 +78,14 @@ class DebugAsyncMock(AsyncMock):
 class RTL433ProcessMock:
     """Mock RTL-433 process with debugging capabilities."""
 
+    _ERROR_SCENARIOS = MappingProxyType({
+        "device_busy": (b"usb_claim_interface error", 1),
+        "device_not_found": (b"not found", 1),
+        "invalid_json": (b"invalid data", 0),
+        "timeout": (b"", -1),
+    })
+    _UNKNOWN_ERROR = (b"unknown error", 1)
+
     def __init__(self, device_id: str = "0"):
         """Initialize RTL-433 process mock."""
         self.device_id = device_id
@@ -48,26 +94,18 @@ class RTL433ProcessMock:
         self.returncode: Optional[int] = None
         self.debug_data = {
             "command_history": [],
-            "data_sent": [],
             "errors_generated": []
         }
 
     def configure_normal_operation(self) -> None:
         """Configure mock for normal operation."""
-        self.stdout.readline.side_effect = self._generate_sample_data()
+        self.stdout.readline.side_effect = iter(_SAMPLE_DATA_BYTES)
         self.stderr.read.return_value = b""
         self.returncode = 0
 
     def configure_error_scenario(self, scenario: str) -> None:
         """Configure mock for various error scenarios."""
-        scenarios = {
-            "device_busy": (b"usb_claim_interface error", 1),
-            "device_not_found": (b"not found", 1),
-            "invalid_json": (b"invalid data", 0),
-            "timeout": (b"", -1),
-        }
-        
-        error_output, return_code = scenarios.get(scenario, (b"unknown error", 1))
+        error_output, return_code = self._ERROR_SCENARIOS.get(scenario, self._UNKNOWN_ERROR)
         self.stderr.read.return_value = error_output
         self.returncode = return_code
         self.debug_data["errors_generated"].append({
@@ -76,65 +114,30 @@ class RTL433ProcessMock:
             "return_code": return_code
         })
 
-    def _generate_sample_data(self):
-        """Generate sample RTL-433 data with debugging info."""
-        sample_data = [
-            {
-                "model": "Acurite-Tower",
-                "id": 1234,
-                "temperature_C": 22.5,
-                "humidity": 45,
-                "battery_ok": 1,
-                "channel": "A",
-                "_debug": {
-                    "timestamp": "2024-01-01 00:00:00",
-                    "signal_strength": -75
-                }
-            },
-            {
-                "model": "Oregon-THN128",
-                "id": 5678,
-                "temperature_C": 23.0,
-                "battery": 1,
-                "_debug": {
-                    "timestamp": "2024-01-01 00:00:01",
-                    "signal_strength": -80
-                }
-            }
-        ]
-
-        async def generate():
-            for data in sample_data:
-                json_data = json.dumps(data).encode() + b"\n"
-                self.debug_data["data_sent"].append(data)
-                yield json_data
-
-        return generate().__aiter__().__anext__
-
     def get_debug_report(self) -> str:
         """Generate a debug report of mock's operation."""
-        report = [
-            "RTL-433 Process Mock Report:",
-            f"Device ID: {self.device_id}",
-            f"Return Code: {self.returncode}",
-            f"Commands Received: {len(self.debug_data['command_history'])}",
-            f"Data Packets Sent: {len(self.debug_data['data_sent'])}",
-            f"Errors Generated: {len(self.debug_data['errors_generated'])}"
-        ]
-
-        if self.debug_data["command_history"]:
-            report.append("\nCommand History:")
-            for cmd in self.debug_data["command_history"]:
-                report.append(f"- {cmd}")
-
-        if self.debug_data["errors_generated"]:
-            report.append("\nErrors Generated:")
-            for error in self.debug_data["errors_generated"]:
-                report.append(f"- Scenario: {error['scenario']}")
-                report.append(f"  Output: {error['output']}")
-                report.append(f"  Return Code: {error['return_code']}")
-
-        return "\n".join(report)
+        history = self.debug_data["command_history"]
+        errors = self.debug_data["errors_generated"]
+        # Each readline call hands out one pre-encoded sample line
+        sent = min(self.stdout.readline.call_count, len(_SAMPLE_DATA_BYTES))
+        report = (
+            "RTL-433 Process Mock Report:\n"
+            f"Device ID: {self.device_id}\n"
+            f"Return Code: {self.returncode}\n"
+            f"Commands Received: {len(history)}\n"
+            f"Data Packets Sent: {sent}\n"
+            f"Errors Generated: {len(errors)}"
+        )
+        if history:
+            report += "\n\nCommand History:\n" + "\n".join(f"- {cmd}" for cmd in history)
+        if errors:
+            report += "\n\nErrors Generated:\n" + "\n".join(
+                f"- Scenario: {error['scenario']}\n"
+                f"  Output: {error['output']}\n"
+                f"  Return Code: {error['return_code']}"
+                for error in errors
+            )
+        return report
 
 class HomeAssistantMock:
     """Mock Home Assistant with debugging capabilities."""
@@ -2,13 +2,29 @@
 import asyncio
 import json
 import logging
+import os
 import pytest
 from unittest.mock import patch
 
+from .test_fixtures import RTL433ProcessMock
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 _LOGGER = logging.getLogger(__name__)
 
-async def run_rtl433(device_id="0", frequency="433.92M", gain=40):
-    """Run rtl_433 and return the first line of output with debug info."""
+# Captured at import, before conftest patches it, so the integration test can
+# still spawn the real rtl_433
+_create_subprocess_exec = asyncio.create_subprocess_exec
+
+async def run_rtl433(device_id="0", frequency="433.92M", gain=40, timeout=5.0):
+    """Run rtl_433 and return the first line of output with debug info.
+
+    A timeout of None waits for the process without arming a timer, for
+    mocked processes that can't hang.
+    """
     cmd = [
         "rtl_433",
         "-d", str(device_id),
@@ -28,7 +44,8 @@ async def run_rtl433(device_id="0", frequency="433.92M", gain=40):
         
         try:
             _LOGGER.debug("Waiting for RTL-433 process output")
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=5.0)
+            async with asyncio.timeout(timeout):
+                stdout, stderr = await process.communicate()
             
             if process.returncode != 0:
                 error_msg = stderr.decode() if stderr else "Process failed with no error message"
@@ -37,9 +54,19 @@ async def run_rtl433(device_id="0", frequency="433.92M", gain=40):
                 
             # Try to parse the first line as JSON
             if stdout:
-                for line in stdout.decode().splitlines():
+                # Usually there is exactly one line, so try the whole buffer first
+                try:
+                    data = json_loads(stdout)
+                    _LOGGER.debug("Successfully parsed RTL-433 data: %s", data)
+                    return data, None
+                except json.JSONDecodeError:
+                    pass
+
+                for line in stdout.split(b"\n"):
+                    if not line.strip():
+                        continue
                     try:
-                        data = json.loads(line)
+                        data = json_loads(line)
                         _LOGGER.debug("Successfully parsed RTL-433 data: %s", data)
                         return data, None
                     except json.JSONDecodeError as err:
@@ -69,30 +96,38 @@ async def test_rtl433_process_mock(mock_rtl433_process, enable_debug_logging):
     
     with patch('asyncio.create_subprocess_exec', return_value=mock_rtl433_process):
         mock_rtl433_process.configure_normal_operation()
-        data, error = await run_rtl433()
+        data, error = await run_rtl433(timeout=None)
         
         assert error is None, f"Unexpected error: {error}"
         assert data is not None, "No data received"
         assert "model" in data, "Missing model in data"
         
-        debug_report = mock_rtl433_process.get_debug_report()
-        _LOGGER.debug("RTL-433 process mock test completed:\n%s", debug_report)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            debug_report = mock_rtl433_process.get_debug_report()
+            _LOGGER.debug("RTL-433 process mock test completed:\n%s", debug_report)
 
 @pytest.mark.asyncio
-async def test_rtl433_process_error_mock(mock_rtl433_process, enable_debug_logging):
+async def test_rtl433_process_error_mock(enable_debug_logging):
     """Test RTL-433 process error handling with debug tracking."""
-    with patch('asyncio.create_subprocess_exec', return_value=mock_rtl433_process):
-        error_scenarios = ["device_busy", "device_not_found", "invalid_json"]
+    error_scenarios = ["device_busy", "device_not_found", "invalid_json"]
+
+    # One mock per scenario, handed out in the order the runs start
+    processes = [RTL433ProcessMock() for _ in error_scenarios]
+    for scenario, process in zip(error_scenarios, processes):
+        process.configure_error_scenario(scenario)
+
+    with patch('asyncio.create_subprocess_exec', side_effect=processes):
+        results = await asyncio.gather(
+            *(run_rtl433(timeout=None) for _ in error_scenarios)
+        )
+
+    for scenario, process, (data, error) in zip(error_scenarios, processes, results):
+        _LOGGER.debug("Testing error scenario: %s", scenario)
+        assert data is None, f"Expected no data for {scenario}"
+        assert error is not None, f"Expected error for {scenario}"
         
-        for scenario in error_scenarios:
-            _LOGGER.debug("Testing error scenario: %s", scenario)
-            mock_rtl433_process.configure_error_scenario(scenario)
-            
-            data, error = await run_rtl433()
-            assert data is None, f"Expected no data for {scenario}"
-            assert error is not None, f"Expected error for {scenario}"
-            
-            debug_report = mock_rtl433_process.get_debug_report()
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            debug_report = process.get_debug_report()
             _LOGGER.debug("Error scenario test completed:\n%s", debug_report)
 
 @pytest.mark.asyncio
@@ -103,53 +138,70 @@ async def test_rtl433_multiple_devices(mock_rtl433_process, enable_debug_logging
     with patch('asyncio.create_subprocess_exec', return_value=mock_rtl433_process):
         # Configure mock for multiple devices
         mock_rtl433_process.configure_normal_operation()
-        data, error = await run_rtl433()
+        data, error = await run_rtl433(timeout=None)
         
         assert error is None, f"Unexpected error: {error}"
         assert data is not None, "No data received"
         assert "model" in data, "Missing model in data"
         
-        debug_report = mock_rtl433_process.get_debug_report()
-        _LOGGER.debug("Multiple devices test completed:\n%s", debug_report)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            debug_report = mock_rtl433_process.get_debug_report()
+            _LOGGER.debug("Multiple devices test completed:\n%s", debug_report)
 
 @pytest.mark.asyncio
-async def test_rtl433_parameter_validation(mock_rtl433_process, enable_debug_logging):
+async def test_rtl433_parameter_validation(enable_debug_logging):
     """Test RTL-433 parameter validation with debug tracking."""
-    with patch('asyncio.create_subprocess_exec', return_value=mock_rtl433_process):
-        test_cases = [
-            ("1", "433.92M", 40),  # Different device ID
-            ("0", "315M", 40),    # Different frequency
-            ("0", "433.92M", 50), # Different gain
-        ]
-        
-        for device_id, freq, gain in test_cases:
-            _LOGGER.debug(
-                "Testing parameters: device_id=%s, frequency=%s, gain=%d",
-                device_id, freq, gain
-            )
-            
-            mock_rtl433_process.configure_normal_operation()
-            data, error = await run_rtl433(
-                device_id=device_id,
-                frequency=freq,
-                gain=gain
+    test_cases = [
+        ("1", "433.92M", 40),  # Different device ID
+        ("0", "315M", 40),    # Different frequency
+        ("0", "433.92M", 50), # Different gain
+    ]
+
+    # One mock per case, handed out in the order the runs start
+    processes = [RTL433ProcessMock() for _ in test_cases]
+    for process in processes:
+        process.configure_normal_operation()
+
+    with patch('asyncio.create_subprocess_exec', side_effect=processes):
+        results = await asyncio.gather(
+            *(
+                run_rtl433(
+                    device_id=device_id,
+                    frequency=freq,
+                    gain=gain,
+                    timeout=None,
+                )
+                for device_id, freq, gain in test_cases
             )
-            
-            assert error is None, f"Unexpected error: {error}"
-            assert data is not None, "No data received"
-            assert "model" in data, "Missing model in data"
-            
-            debug_report = mock_rtl433_process.get_debug_report()
+        )
+
+    for (device_id, freq, gain), process, (data, error) in zip(test_cases, processes, results):
+        _LOGGER.debug(
+            "Testing parameters: device_id=%s, frequency=%s, gain=%d",
+            device_id, freq, gain
+        )
+        assert error is None, f"Unexpected error: {error}"
+        assert data is not None, "No data received"
+        assert "model" in data, "Missing model in data"
+        
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            debug_report = process.get_debug_report()
             _LOGGER.debug("Parameter validation test completed:\n%s", debug_report)
 
 @pytest.mark.asyncio
 @pytest.mark.integration
+@pytest.mark.skipif(
+    not os.environ.get("RTL433_TEST_HARDWARE"),
+    reason="Set RTL433_TEST_HARDWARE=1 to run against an attached RTL-SDR",
+)
 async def test_real_rtl433(enable_debug_logging):
     """Test actual RTL-433 process with debug tracking."""
     _LOGGER.debug("Starting real RTL-433 test")
     
     try:
-        data, error = await run_rtl433()
+        # The autouse mock_process_cleanup fixture patches subprocess creation
+        with patch('asyncio.create_subprocess_exec', _create_subprocess_exec):
+            data, error = await run_rtl433()
         if error and "usb_claim_interface error" in error:
             pytest.skip("RTL-SDR device is in use")
         elif error and "not found" in error:
@@ -1,4 +1,5 @@
 """Test the RTL-433 sensor platform."""
+import asyncio
 import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
 from homeassistant.core import HomeAssistant
@@ -7,18 +8,23 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.const import CONF_DEVICE_ID
-from custom_components.rtl433.sensor import async_setup_entry
+from custom_components.rtl433.sensor import (
+    LAST_UPDATE_REFRESH_INTERVAL,
+    RTL433Sensor,
+    async_setup_entry,
+)
 from custom_components.rtl433.const import DOMAIN
-from custom_components.rtl433.coordinator import RTL433Coordinator
+from custom_components.rtl433.coordinator import UPDATE_FLUSH_DELAY, RTL433Coordinator
 
 @pytest.fixture
 def mock_coordinator(hass):
     """Create a mock coordinator."""
-    coordinator = RTL433Coordinator(hass, "test_entry", {
-        "device": "0",
-        "frequency": "433.92M",
-        "gain": 40,
-    })
+    coordinator = RTL433Coordinator(
+        hass,
+        device_id="0",
+        frequency="433.92M",
+        gain=40,
+    )
     coordinator.data = {
         "Acurite-Tower_1234": {
             "model": "Acurite-Tower",
@@ -126,4 +132,63 @@ async def test_sensor_update(hass: HomeAssistant, config_entry, mock_coordinator
     mock_coordinator.async_set_updated_data(mock_coordinator.data)
     
     # Verify sensor state updated
-    assert temp_sensor.native_value == 23.5
\ No newline at end of file
+    assert temp_sensor.native_value == 23.5
+@pytest.mark.asyncio
+async def test_sensor_last_update_refresh(hass: HomeAssistant, mock_coordinator):
+    """Test an unchanged reading still republishes last_update periodically."""
+    record = {
+        "device_info": {"identifiers": {(DOMAIN, "Acurite-5n1_1234")}},
+        "sensor_data": {"temperature_C": 22.5},
+        "last_update": "2024-01-01 00:00:00",
+    }
+    mock_coordinator.data = {"Acurite-5n1_1234": record}
+    sensor = RTL433Sensor(
+        coordinator=mock_coordinator,
+        device_id="Acurite-5n1_1234",
+        sensor_type="temperature_C",
+        model="Acurite-5n1",
+    )
+
+    with patch.object(sensor, "async_write_ha_state") as write_state, \
+         patch("custom_components.rtl433.sensor.time.monotonic") as monotonic:
+        monotonic.return_value = 1000.0
+        sensor._handle_coordinator_update()
+        assert write_state.call_count == 1
+
+        # Same reading within the refresh interval is skipped
+        record["last_update"] = "2024-01-01 00:00:10"
+        monotonic.return_value = 1010.0
+        sensor._handle_coordinator_update()
+        assert write_state.call_count == 1
+
+        # Past the interval the newer last_update is written
+        monotonic.return_value = 1000.0 + LAST_UPDATE_REFRESH_INTERVAL
+        sensor._handle_coordinator_update()
+        assert write_state.call_count == 2
+        assert sensor.extra_state_attributes["last_update"] == "2024-01-01 00:00:10"
+
+        # A changed reading is written straight away
+        record["sensor_data"] = {"temperature_C": 23.0}
+        monotonic.return_value += 1
+        sensor._handle_coordinator_update()
+        assert write_state.call_count == 3
+
+@pytest.mark.asyncio
+async def test_sensor_added_on_new_device(hass: HomeAssistant):
+    """Test sensors are created when the coordinator announces a new device."""
+    coordinator = RTL433Coordinator(hass, device_id="0")
+    config_entry = MagicMock(entry_id="test")
+    hass.data.setdefault(DOMAIN, {})
+    hass.data[DOMAIN][config_entry.entry_id] = {"coordinator": coordinator}
+
+    async_add_entities = MagicMock()
+    await async_setup_entry(hass, config_entry, async_add_entities)
+    async_add_entities.assert_not_called()
+
+    coordinator._process_batch(({"model": "LaCrosse-TX141W", "id": 5678, "temperature_C": 20.1},))
+    await asyncio.sleep(UPDATE_FLUSH_DELAY + 0.05)
+    await hass.async_block_till_done()
+
+    assert async_add_entities.call_count == 1
+    entities = async_add_entities.call_args[0][0]
+    assert [entity.unique_id for entity in entities] == ["LaCrosse-TX141W_5678_temperature_C"]
@@ -1,37 +1,53 @@
 import asyncio
-import psutil
 import logging
+import os
+import signal
 from typing import Optional, List
 from asyncio import Task
 
+from .test_cleanup import read_process_table
+
 _LOGGER = logging.getLogger(__name__)
 
+# Executable name of rtl_433 as reported by the process table
+_RTL_NAMES = frozenset({"rtl_433"})
+
+def _find_rtl433_pids() -> List[int]:
+    """Return the PIDs of running rtl_433 processes."""
+    return [pid for pid, name in read_process_table() if name in _RTL_NAMES]
+
 def kill_rtl433_processes():
     """Kill any lingering rtl_433 processes."""
     killed = []
-    for proc in psutil.process_iter(['pid', 'name']):
+    # Bind the per-PID lookups once; the loop may cover many processes
+    kill, sigkill, add_killed = os.kill, signal.SIGKILL, killed.append
+    for pid in _find_rtl433_pids():
         try:
-            if 'rtl_433' in proc.info['name']:
-                proc.kill()
-                killed.append(proc.info['pid'])
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            kill(pid, sigkill)
+            add_killed(pid)
+        except (ProcessLookupError, PermissionError):
             continue
     if killed:
-        _LOGGER.debug(f"Killed rtl_433 processes with PIDs: {killed}")
+        _LOGGER.debug("Killed rtl_433 processes with PIDs: %s", killed)
 
 async def cleanup_tasks(tasks: List[Optional[Task]]):
     """Clean up async tasks safely."""
-    for task in tasks:
-        if task and not task.done():
-            task.cancel()
-            try:
-                await task
-            except (asyncio.CancelledError, Exception) as e:
-                _LOGGER.debug(f"Task cleanup error: {str(e)}")
+    # cancel() is a no-op on finished tasks, so there's no need to check first
+    live = [task for task in tasks if task is not None]
+    if not live:
+        return
+    for task in live:
+        task.cancel()
+    # Wait for all cancellations together rather than one after another
+    results = await asyncio.gather(*live, return_exceptions=True)
+    for result in results:
+        # CancelledError is the expected outcome, not a cleanup error
+        if isinstance(result, Exception):
+            _LOGGER.debug("Task cleanup error: %r", result)
 
 async def wait_for_cleanup(timeout: float = 0.1):
-    """Wait for a short period to allow cleanup operations."""
-    try:
-        await asyncio.wait_for(asyncio.sleep(0), timeout=timeout)
-    except asyncio.TimeoutError:
-        pass 
\ No newline at end of file
+    """Yield to the event loop once so pending cleanup callbacks can run.
+
+    timeout is kept for compatibility; a zero-length sleep can't overrun it.
+    """
+    await asyncio.sleep(0) 
\ No newline at end of file